@@ -89,15 +89,39 @@ class SimpleSerialMonitor:
         self.receive_callback = callback
 
     def _monitor_serial(self):
-        """Monitor serial port for incoming data."""
+        """Monitor serial port for incoming data.
+
+        The firmware writes each line as several small prints, so bytes are
+        collected until a newline and the callback gets whole lines. Splitting
+        on the newline byte never cuts a multi-byte UTF-8 character.
+        """
+        buffer = b''
         while not self._stop_monitoring and self.is_connected:
             try:
-                if self.connection and self.connection.in_waiting > 0:
-                    data = self.connection.read(self.connection.in_waiting)
-                    if data and self.receive_callback:
-                        text = data.decode('utf-8', errors='ignore')
-                        self.receive_callback(text)
-                time.sleep(0.01)
+                if not self.connection:
+                    time.sleep(0.01)
+                    continue
+                # Block until data arrives instead of polling; the read timeout
+                # bounds the wait so the stop flag is still checked regularly
+                data = self.connection.read(1)
+                if data:
+                    waiting = self.connection.in_waiting
+                    if waiting:
+                        data += self.connection.read(waiting)
+                    buffer += data
+                    end = buffer.rfind(b'\n') + 1
+                    if not end:
+                        continue
+                    complete, buffer = buffer[:end], buffer[end:]
+                elif buffer:
+                    # Line went quiet without a newline (e.g. a prompt): pass it on
+                    complete, buffer = buffer, b''
+                else:
+                    continue
+                if self.receive_callback:
+                    text = complete.decode('utf-8', errors='ignore')
+                    for line in text.splitlines(keepends=True):
+                        self.receive_callback(line)
             except Exception as e:
                 if self.is_connected:  # Only report errors if we're supposed to be connected
                     self.last_error = f"Monitor error: {str(e)}"
@@ -5,13 +5,26 @@ Refactored from original simple_gui.py with additional features.
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import re
+import io
 import json
 import os
 import sys
+import time
 import csv
+import functools
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque, namedtuple
+from enum import Enum
 from datetime import datetime
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional faster JSON; the standard json module is used instead
+
 # Add src directory to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 src_dir = os.path.dirname(current_dir)
@@ -21,10 +34,125 @@ if src_dir not in sys.path:
 from widgets import SerialMonitorWidget, ParameterPanel
 from core.parameter_monitor import ParameterMonitor
 
+logger = logging.getLogger(__name__)
+
+
+# Serial response patterns, compiled once for the per-line parsing path. They
+# are matched against the lowercased line, so no re.IGNORECASE is needed.
+# Parameter reports: "[INFO] Motor Run Time: 20 seconds" or "[OK] Motor Run Time = 12 seconds"
+_PARAM_RE = re.compile(
+    r'(?P<key>motor run time|total flight time|motor speed|dt retracted|dt deployed|dt dwell)'
+    r'[:\s=]+(?P<val>\d+)')
+_PHASE_RE = re.compile(r'current phase:\s*([a-z_]+)')
+_GPS_RE = re.compile(r'gps status:\s*([^()\n]+)')
+_TIME_RE = re.compile(r'(?:flight time|elapsed):\s*(?:(\d+)s|(\d+):(\d+))')
+# Complete download row: "GPS,ts_ms,state,name,lat,lon[,alt]" with all coordinates present
+_GPS_ROW_RE = re.compile(r'GPS,\d+,\d+,[^,]*,-?\d+\.\d+,-?\d+\.\d+(?:,-?\d+\.\d+)?$')
+# Recorded GPS fix count from the help output: "GPS Status: Available (42 positions recorded)"
+_POS_COUNT_RE = re.compile(r'\((\d+) positions recorded\)')
+
+# Result of FlightSequencerTab._parse_line: params is a tuple of
+# (store key, history message or None, value) for each parameter reported
+_ParsedLine = namedtuple('_ParsedLine', 'params is_set phase gps_state timer')
+
+# One downloaded GPS position, as held in flight_data['position_records']
+_GpsRecord = namedtuple('_GpsRecord', 'timestamp_ms flight_state state_name latitude longitude altitude')
+
+
+class _DownloadState(Enum):
+    """Flight data download progress, advanced by the firmware's framing markers."""
+    IDLE = "idle"
+    WAITING_HEADER = "waiting_header"   # "D J" sent, no [START_FLIGHT_DATA] yet
+    STREAMING = "streaming"             # Between START and END markers
+    DONE = "done"                       # [END_FLIGHT_DATA] or no-records sentinel seen
+
 
 class FlightSequencerTab:
     """Enhanced FlightSequencer tab with profiles and monitoring."""
-    
+
+    # Flight history entries kept in memory and shown in the history pane
+    _HISTORY_MAX_ENTRIES = 1000
+
+    # Delay before pending history entries are shown; a burst arriving over
+    # several serial drains is inserted in one flush
+    _HISTORY_FLUSH_MS = 50
+
+    # KML coordinate line: lon,lat,alt
+    _KML_COORD_FMT = "          %.7f,%.7f,%.2f\n"
+
+    # Most time-coloured points drawn on the flight path map; longer flights
+    # are thinned for the scatter only, the path line keeps every point
+    _PLOT_MAX_SCATTER_POINTS = 2000
+
+    # Fields every GPS position record must carry (altitude is optional)
+    _GPS_RECORD_FIELDS = ('timestamp_ms', 'flight_state', 'state_name', 'latitude', 'longitude')
+
+    # Flights with more GPS records than this are saved as compact JSON
+    _JSON_COMPACT_RECORDS = 1000
+
+    # Download watchdogs: time allowed for the firmware to start answering,
+    # then the longest gap tolerated between chunks once records are streaming
+    _DL_START_TIMEOUT_MS = 10000
+    _DL_IDLE_TIMEOUT_MS = 2000
+
+    # Responses the parsers act on carry a tag ("[INFO]") or a "key: value" /
+    # "key = value" pair, or one of _INTEREST_WORDS; anything else is only displayed
+    _INTEREST_CHARS = (':', '=', '[')
+
+    # Received data is handed over by the serial reader thread and drained on
+    # the Tk thread every _RX_POLL_MS, at most _RX_BATCH_MAX chunks per pass
+    _RX_POLL_MS = 20
+    _RX_BATCH_MAX = 64
+
+    # _PARAM_RE key -> (parameter store key, history message
+    # logged when the value is set, or None for parameters not logged)
+    _PARAM_SPEC = {
+        'motor run time': ('motor_run_time', "Motor run time set to {} seconds"),
+        'total flight time': ('total_flight_time', "Total flight time set to {} seconds"),
+        'motor speed': ('motor_speed', "Motor speed set to {}"),
+        'dt retracted': ('dt_retracted', None),
+        'dt deployed': ('dt_deployed', None),
+        'dt dwell': ('dt_dwell', None)
+    }
+
+    # State transition messages as (lowercase keywords, phase); an entry matches
+    # when all of its keywords appear in the line, first match wins
+    _PHASE_KEYWORDS = (
+        (('system ready',), 'READY'),
+        (('ready for new flight',), 'READY'),
+        (('system armed',), 'ARMED'),
+        (('launch', 'motor'), 'MOTOR_SPOOL'),
+        (('motor spooling',), 'MOTOR_SPOOL'),
+        (('motor at flight speed',), 'MOTOR_RUN'),
+        (('motor', 'complete', 'glide'), 'GLIDE'),
+        (('deploying dt',), 'DT_DEPLOY'),
+        (('flight time complete',), 'DT_DEPLOY'),
+        (('dethermalizer deployed',), 'DT_DEPLOYED'),
+        (('flight complete',), 'LANDING')
+    )
+
+    # Untagged text that is still parsed: the first keyword of each state
+    # transition (a phase only matches when all of its keywords are present)
+    # and the flight record notices
+    _INTEREST_WORDS = tuple(dict.fromkeys(keywords[0] for keywords, _ in _PHASE_KEYWORDS)) + (
+        'flight records',)
+
+    # Flight history text for phase and GPS state changes
+    _PHASE_DESCRIPTIONS = {
+        'READY': 'System ready for new flight',
+        'ARMED': 'System armed, ready for launch',
+        'MOTOR_SPOOL': 'Motor spooling up for launch',
+        'MOTOR_RUN': 'Motor running at flight speed',
+        'GLIDE': 'Motor complete, entering glide phase',
+        'DT_DEPLOY': 'Deploying dethermalizer',
+        'DT_DEPLOYED': 'Dethermalizer deployed',
+        'LANDING': 'Flight complete, landing phase'
+    }
+    _GPS_DESCRIPTIONS = {
+        'AVAILABLE': 'GPS module detected and available',
+        'NOT_DETECTED': 'GPS module not detected'
+    }
+
     def __init__(self, parent, serial_monitor, tab_manager, main_gui=None):
         self.parent = parent
         self.serial_monitor = serial_monitor
@@ -33,9 +161,12 @@ class FlightSequencerTab:
         self.param_monitor = ParameterMonitor()
 
         # Flight data management
-        self.flight_data_buffer = ""
-        self.downloading_data = False
+        self.flight_data_buffer = []  # Received chunks, joined once on completion
+        self._dl_state = _DownloadState.IDLE
+        self._dl_watchdog_id = None
         self.last_flight_data = None
+        self.dl_progress = None  # Built with the flight data pane
+        self.current_figure = None
 
         # Single source of truth for flight parameters
         self.current_flight_params = {
@@ -53,9 +184,32 @@ class FlightSequencerTab:
         self.flight_start_time = None
         self.current_timer = "00:00"
 
+        # Serial data from the reader thread, processed on the Tk thread
+        self._rx_queue = queue.Queue()
+        self._rx_after_id = None  # Pending _drain_rx poll, cancelled on destroy
+        self._alive = True  # Cleared when the tab frame is destroyed
+
+        # Default locations for save/open dialogs, relative to the launch directory
+        self._flightdata_dir = os.path.join(os.getcwd(), "flightdata")
+        self._parameters_dir = os.path.join(os.getcwd(), "parameters")
+        self._created_dirs = set()
+
+        # Slow file writes run here; one worker so consecutive saves queue up
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="flight-io")
+
+        # Pending GUI sync (bursts of serial lines share one idle update)
+        self._sync_pending = False
+        self._last_status = (None, None)  # (phase, timer) last sent to main GUI
+        self._last_gps = None  # GPS state last shown in gps_status_var
+
         # Flight history tracking
-        self.flight_history = []
+        self.flight_history = deque(maxlen=self._HISTORY_MAX_ENTRIES)  # (time, event, message)
         self.last_recorded_phase = None
+        self._last_history_key = None  # (event, message) of the newest entry
+        # Entries not yet shown in history_tree; held while the tab is hidden
+        self._history_pending = deque(maxlen=self._HISTORY_MAX_ENTRIES)
+        self._history_flush_pending = False
+        self._history_rows = 0  # Rows currently in history_tree
 
         # Responsive layout state
         self.is_mobile_layout = False
@@ -74,6 +228,10 @@ class FlightSequencerTab:
         self.action_frame = None
         self.action_buttons = {}
 
+        # Flight data and history panes are built on first display
+        self._panes_built = False
+        self.history_tree = None
+
         # Create main tab frame
         self.frame = ttk.Frame(parent)
 
@@ -86,6 +244,8 @@ class FlightSequencerTab:
         from core.tab_manager import ApplicationType
         tab_manager.register_tab(ApplicationType.FLIGHT_SEQUENCER, self.handle_serial_data)
 
+        self._rx_after_id = self.parent.after(self._RX_POLL_MS, self._drain_rx)
+
     def _setup_styles(self):
         """Configure custom styles for the tab."""
         # Styles removed - no custom buttons needed
@@ -102,10 +262,13 @@ class FlightSequencerTab:
         self.left_frame = ttk.Frame(self.frame)
         self.right_frame = ttk.Frame(self.frame)
 
-        # Create control panels (once, never destroyed)
+        # Create control panels (once, never destroyed). The flight data and
+        # history panes are deferred until the tab is first shown; their
+        # status variables exist up front so serial parsing can update them.
         self._create_flight_controls(self.left_frame)
-        self._create_flight_data_controls(self.left_frame)
-        self._create_status_display(self.left_frame)
+        self.records_status_var = tk.StringVar(value="Records: Unknown")
+        self.gps_status_var = tk.StringVar(value="GPS: Unknown")
+        self.frame.bind('<Map>', self._on_map)
 
         # Serial monitor (once, never destroyed)
         self.serial_monitor_widget = SerialMonitorWidget(
@@ -122,8 +285,21 @@ class FlightSequencerTab:
         # Bind resize events to main frame (not individual panels)
         self.frame.bind('<Configure>', self._on_main_frame_resize)
         self.left_frame.bind('<Configure>', self._on_frame_resize)
+        self.frame.bind('<Destroy>', self._on_destroy)
         self.parent.after(200, self._check_width_layout)
 
+    def _on_map(self, event):
+        """Build the deferred panes on first display; later, show history held while hidden."""
+        if event.widget != self.frame:
+            return
+        if not self._panes_built:
+            self._panes_built = True
+            self._create_flight_data_controls(self.left_frame)
+            self._create_status_display(self.left_frame)
+        elif self._history_pending and not self._history_flush_pending:
+            self._history_flush_pending = True
+            self.parent.after(self._HISTORY_FLUSH_MS, self._flush_history)
+
     def _update_grid_layout(self):
         """Update grid layout based on mobile/desktop mode and available space."""
         # Determine if we should stack based on mobile layout OR insufficient space
@@ -159,13 +335,17 @@ class FlightSequencerTab:
         # Parameter controls frame
         param_frame = ttk.LabelFrame(parent, text="Flight Parameters")
         param_frame.pack(fill='x', padx=5, pady=5)
+
+        # Entries accept up to four digits; range checks happen on Set
+        vcmd = (parent.register(self._is_digit_entry), '%P')
         
         # Motor Run Time
         motor_frame = ttk.Frame(param_frame)
         motor_frame.pack(fill='x', padx=5, pady=2)
         ttk.Label(motor_frame, text="Motor Run Time (sec):", width=22).pack(side='left')
         self.motor_time_var = tk.StringVar(value="")
-        motor_entry = ttk.Entry(motor_frame, textvariable=self.motor_time_var, width=8)
+        motor_entry = ttk.Entry(motor_frame, textvariable=self.motor_time_var, width=8,
+                                validate='key', validatecommand=vcmd)
         motor_entry.pack(side='left', padx=5)
         ttk.Button(motor_frame, text="Set", command=self._set_motor_time).pack(side='left', padx=2)
 
@@ -174,7 +354,8 @@ class FlightSequencerTab:
         flight_frame.pack(fill='x', padx=5, pady=2)
         ttk.Label(flight_frame, text="Total Flight Time (sec):", width=22).pack(side='left')
         self.flight_time_var = tk.StringVar(value="")
-        flight_entry = ttk.Entry(flight_frame, textvariable=self.flight_time_var, width=8)
+        flight_entry = ttk.Entry(flight_frame, textvariable=self.flight_time_var, width=8,
+                                 validate='key', validatecommand=vcmd)
         flight_entry.pack(side='left', padx=5)
         ttk.Button(flight_frame, text="Set", command=self._set_flight_time).pack(side='left', padx=2)
 
@@ -183,7 +364,8 @@ class FlightSequencerTab:
         speed_frame.pack(fill='x', padx=5, pady=2)
         ttk.Label(speed_frame, text="Motor Speed (95-200):", width=22).pack(side='left')
         self.motor_speed_var = tk.StringVar(value="")
-        speed_entry = ttk.Entry(speed_frame, textvariable=self.motor_speed_var, width=8)
+        speed_entry = ttk.Entry(speed_frame, textvariable=self.motor_speed_var, width=8,
+                                validate='key', validatecommand=vcmd)
         speed_entry.pack(side='left', padx=5)
         ttk.Button(speed_frame, text="Set", command=self._set_motor_speed).pack(side='left', padx=2)
 
@@ -192,7 +374,8 @@ class FlightSequencerTab:
         dt_retracted_frame.pack(fill='x', padx=5, pady=2)
         ttk.Label(dt_retracted_frame, text="DT Retracted (us):", width=22).pack(side='left')
         self.dt_retracted_var = tk.StringVar(value="")
-        dt_retracted_entry = ttk.Entry(dt_retracted_frame, textvariable=self.dt_retracted_var, width=8)
+        dt_retracted_entry = ttk.Entry(dt_retracted_frame, textvariable=self.dt_retracted_var, width=8,
+                                       validate='key', validatecommand=vcmd)
         dt_retracted_entry.pack(side='left', padx=5)
         ttk.Button(dt_retracted_frame, text="Set", command=self._set_dt_retracted).pack(side='left', padx=2)
 
@@ -201,7 +384,8 @@ class FlightSequencerTab:
         dt_deployed_frame.pack(fill='x', padx=5, pady=2)
         ttk.Label(dt_deployed_frame, text="DT Deployed (us):", width=22).pack(side='left')
         self.dt_deployed_var = tk.StringVar(value="")
-        dt_deployed_entry = ttk.Entry(dt_deployed_frame, textvariable=self.dt_deployed_var, width=8)
+        dt_deployed_entry = ttk.Entry(dt_deployed_frame, textvariable=self.dt_deployed_var, width=8,
+                                      validate='key', validatecommand=vcmd)
         dt_deployed_entry.pack(side='left', padx=5)
         ttk.Button(dt_deployed_frame, text="Set", command=self._set_dt_deployed).pack(side='left', padx=2)
 
@@ -210,7 +394,8 @@ class FlightSequencerTab:
         dt_dwell_frame.pack(fill='x', padx=5, pady=2)
         ttk.Label(dt_dwell_frame, text="DT Dwell Time (sec):", width=22).pack(side='left')
         self.dt_dwell_var = tk.StringVar(value="")
-        dt_dwell_entry = ttk.Entry(dt_dwell_frame, textvariable=self.dt_dwell_var, width=8)
+        dt_dwell_entry = ttk.Entry(dt_dwell_frame, textvariable=self.dt_dwell_var, width=8,
+                                   validate='key', validatecommand=vcmd)
         dt_dwell_entry.pack(side='left', padx=5)
         ttk.Button(dt_dwell_frame, text="Set", command=self._set_dt_dwell).pack(side='left', padx=2)
 
@@ -244,10 +429,8 @@ class FlightSequencerTab:
         status_frame = ttk.Frame(data_frame)
         status_frame.pack(fill='x', padx=5, pady=2)
 
-        self.records_status_var = tk.StringVar(value="Records: Unknown")
         ttk.Label(status_frame, textvariable=self.records_status_var).pack(side='left')
 
-        self.gps_status_var = tk.StringVar(value="GPS: Unknown")
         ttk.Label(status_frame, textvariable=self.gps_status_var).pack(side='right')
 
         # Download controls
@@ -261,17 +444,20 @@ class FlightSequencerTab:
         ttk.Button(download_frame, text="View Flight",
                   command=self._view_flight_path).pack(side='right', padx=2)
 
+        # Download progress, packed only while a download is running
+        self.dl_progress = ttk.Progressbar(data_frame, mode='indeterminate')
+
     def _create_status_display(self, parent):
         """Create flight history display using grid layout."""
         history_frame = ttk.LabelFrame(parent, text="Flight History")
         history_frame.pack(fill='both', expand=True, padx=5, pady=5)
 
         # Configure grid weights for Flight History
-        history_frame.grid_rowconfigure(0, weight=1)  # Text area (expandable)
+        history_frame.grid_rowconfigure(0, weight=1)  # History list (expandable)
         history_frame.grid_rowconfigure(1, weight=0)  # Clear button (fixed)
         history_frame.grid_columnconfigure(0, weight=1)
 
-        # Create scrollable text widget for flight history
+        # Create scrollable list for flight history
         history_container = ttk.Frame(history_frame)
         history_container.grid(row=0, column=0, sticky='nsew', padx=5, pady=(5, 0))
 
@@ -279,19 +465,28 @@ class FlightSequencerTab:
         history_container.grid_columnconfigure(0, weight=1)
         history_container.grid_rowconfigure(0, weight=1)
 
-        # Text widget with minimum 10 lines, scrollbar always visible
-        self.history_text = tk.Text(history_container, height=10, wrap='word',
-                                   font=('Consolas', 9), state='disabled',
-                                   bg='white', relief='sunken', borderwidth=2)
+        # Treeview with minimum 10 rows, scrollbar always visible. Only the
+        # visible rows are drawn, so long sessions stay cheap to append to.
+        self.history_tree = ttk.Treeview(history_container, columns=('time', 'event', 'message'),
+                                         show='headings', height=10, selectmode='none')
+        self.history_tree.heading('time', text="Time", anchor='w')
+        self.history_tree.heading('event', text="Event", anchor='w')
+        self.history_tree.heading('message', text="Message", anchor='w')
+        self.history_tree.column('time', width=70, minwidth=70, stretch=False)
+        self.history_tree.column('event', width=80, minwidth=60, stretch=False)
+        self.history_tree.column('message', width=250, minwidth=100, stretch=True)
 
         # Scrollbar (always visible for consistency)
         history_scrollbar = ttk.Scrollbar(history_container, orient='vertical',
-                                         command=self.history_text.yview)
-        self.history_text.configure(yscrollcommand=history_scrollbar.set)
+                                         command=self.history_tree.yview)
+        self.history_tree.configure(yscrollcommand=history_scrollbar.set)
 
-        self.history_text.grid(row=0, column=0, sticky='nsew')
+        self.history_tree.grid(row=0, column=0, sticky='nsew')
         history_scrollbar.grid(row=0, column=1, sticky='ns')
 
+        # Show any entries recorded before the pane existed
+        self._rebuild_history_list()
+
         # Clear button frame (row 1, never expands, always visible)
         clear_frame = ttk.Frame(history_frame)
         clear_frame.grid(row=1, column=0, sticky='ew', padx=5, pady=(2, 5))
@@ -311,83 +506,47 @@ class FlightSequencerTab:
         else:
             messagebox.showwarning("Not Connected", "Please connect to Arduino first")
             
-    def _set_motor_time(self):
-        """Set motor run time parameter."""
+    @staticmethod
+    def _is_digit_entry(proposed):
+        """Entry validatecommand: allow only short unsigned integers."""
+        return proposed == '' or (proposed.isdigit() and len(proposed) <= 4)
+
+    def _set_param(self, var, command, low, high, message):
+        """Range-check an integer entry and send it with the given command."""
         try:
-            time_val = self.motor_time_var.get().strip()
-            # Validate range
-            time_int = int(time_val)
-            if not (1 <= time_int <= 300):
-                raise ValueError("Motor time must be 1-300 seconds")
-            command = f"M {time_val}"
-            self._send_command(command)
+            value = int(var.get().strip())
+            if not (low <= value <= high):
+                raise ValueError(message)
         except ValueError as e:
             messagebox.showerror("Invalid Value", str(e))
-            
+            return
+        self._send_command(f"{command} {value}")
+
+    def _set_motor_time(self):
+        """Set motor run time parameter."""
+        self._set_param(self.motor_time_var, "M", 1, 300, "Motor time must be 1-300 seconds")
+
     def _set_flight_time(self):
         """Set total flight time parameter."""
-        try:
-            time_val = self.flight_time_var.get().strip()
-            # Validate range
-            time_int = int(time_val)
-            if not (10 <= time_int <= 600):
-                raise ValueError("Flight time must be 10-600 seconds")
-            command = f"T {time_val}"
-            self._send_command(command)
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
-            
+        self._set_param(self.flight_time_var, "T", 10, 600, "Flight time must be 10-600 seconds")
+
     def _set_motor_speed(self):
         """Set motor speed parameter."""
-        try:
-            speed_val = self.motor_speed_var.get().strip()
-            # Validate range
-            speed_int = int(speed_val)
-            if not (95 <= speed_int <= 200):
-                raise ValueError("Motor speed must be 95-200")
-            command = f"S {speed_val}"
-            self._send_command(command)
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
+        self._set_param(self.motor_speed_var, "S", 95, 200, "Motor speed must be 95-200")
 
     def _set_dt_retracted(self):
         """Set DT retracted position parameter."""
-        try:
-            pos_val = self.dt_retracted_var.get().strip()
-            # Validate range (standard servo range)
-            pos_int = int(pos_val)
-            if not (950 <= pos_int <= 2050):
-                raise ValueError("DT retracted position must be 950-2050 microseconds")
-            command = f"DR {pos_val}"
-            self._send_command(command)
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
+        self._set_param(self.dt_retracted_var, "DR", 950, 2050,
+                        "DT retracted position must be 950-2050 microseconds")
 
     def _set_dt_deployed(self):
         """Set DT deployed position parameter."""
-        try:
-            pos_val = self.dt_deployed_var.get().strip()
-            # Validate range (standard servo range)
-            pos_int = int(pos_val)
-            if not (950 <= pos_int <= 2050):
-                raise ValueError("DT deployed position must be 950-2050 microseconds")
-            command = f"DD {pos_val}"
-            self._send_command(command)
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
+        self._set_param(self.dt_deployed_var, "DD", 950, 2050,
+                        "DT deployed position must be 950-2050 microseconds")
 
     def _set_dt_dwell(self):
         """Set DT dwell time parameter."""
-        try:
-            time_val = self.dt_dwell_var.get().strip()
-            # Validate range
-            time_int = int(time_val)
-            if not (1 <= time_int <= 60):
-                raise ValueError("DT dwell time must be 1-60 seconds")
-            command = f"DW {time_val}"
-            self._send_command(command)
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
+        self._set_param(self.dt_dwell_var, "DW", 1, 60, "DT dwell time must be 1-60 seconds")
 
     def _get_parameters(self):
         """Get current parameters from FlightSequencer."""
@@ -400,39 +559,90 @@ class FlightSequencerTab:
             self._send_command("R")
             
     def handle_serial_data(self, data):
-        """Handle incoming serial data for FlightSequencer."""
+        """Handle incoming serial data for FlightSequencer.
+
+        Called on the serial reader thread; the data is only queued here and
+        processed on the Tk thread by _drain_rx.
+        """
+        self._rx_queue.put(data)
+
+    def _drain_rx(self):
+        """Process queued serial data in batches, then reschedule."""
+        try:
+            changed = False
+            for _ in range(self._RX_BATCH_MAX):
+                try:
+                    data = self._rx_queue.get_nowait()
+                except queue.Empty:
+                    break
+                # One bad chunk must not stop the polling loop
+                try:
+                    changed |= self._process_serial_data(data)
+                except Exception:
+                    logger.exception("Error handling FlightSequencer data")
+
+            # Update GUI to reflect current parameter store, once per batch
+            if changed:
+                self._sync_gui_with_parameters()
+        except Exception:
+            logger.exception("Error updating FlightSequencer display")
+        finally:
+            if self._alive:
+                self._rx_after_id = self.parent.after(self._RX_POLL_MS, self._drain_rx)
+
+    def _on_destroy(self, event):
+        """Stop polling for serial data once the tab frame is destroyed."""
+        if event.widget != self.frame:
+            return
+        self._alive = False
+        if self._rx_after_id is not None:
+            try:
+                self.parent.after_cancel(self._rx_after_id)
+            except tk.TclError:
+                pass  # Parent already gone
+            self._rx_after_id = None
+
+    def _process_serial_data(self, data):
+        """Display and parse one received chunk; returns True if the store changed."""
         # Display in serial monitor
         self.serial_monitor_widget.log_received(data)
 
-        # Update canonical parameter store from ANY Arduino response
-        self._update_parameter_store(data)
+        # Case-insensitive checks below all share one lowercased copy
+        data_lower = data.lower()
 
-        # Update GUI to reflect current parameter store
-        self._sync_gui_with_parameters()
+        # Fast path: untagged chatter needs no parsing (download CSV rows are
+        # untagged too, so keep parsing while a download is in progress)
+        if (not self.downloading_data and not any(c in data for c in self._INTEREST_CHARS)
+                and not any(word in data_lower for word in self._INTEREST_WORDS)):
+            return False
+
+        # Update canonical parameter store from ANY Arduino response
+        changed = self._update_parameter_store(data_lower)
 
         # Handle flight data download
-        self._handle_flight_data_response(data)
+        self._handle_flight_data_response(data, data_lower)
 
         # Track other significant events
-        self._track_flight_events(data)
+        self._track_flight_events(data, data_lower)
+        return changed
 
-    def _track_flight_events(self, data):
+    def _track_flight_events(self, data, data_lower):
         """Track significant flight events for history."""
         # Flight data events
-        if "flight records downloaded" in data.lower():
+        if "flight records downloaded" in data_lower:
             self._add_history_entry("DATA", "Flight data downloaded successfully")
-        elif "flight records cleared" in data.lower():
+        elif "flight records cleared" in data_lower:
             self._add_history_entry("DATA", "Flight records cleared")
 
-        # Error events
-        if re.search(r'\[ERROR\]', data, re.IGNORECASE):
+        # Error events (the firmware always emits log-level tags in upper case)
+        if "[ERROR]" in data:
             error_msg = data.strip()
             if len(error_msg) > 100:
                 error_msg = error_msg[:97] + "..."
             self._add_history_entry("ERROR", error_msg.replace("[ERROR]", "").strip())
 
         # Warning events
-        if re.search(r'\[WARN\]', data, re.IGNORECASE):
+        if "[WARN]" in data:
             warning_msg = data.strip()
             if len(warning_msg) > 100:
                 warning_msg = warning_msg[:97] + "..."
@@ -481,203 +691,207 @@ class FlightSequencerTab:
             # Clear main GUI status bar
             if self.main_gui:
                 self.main_gui.clear_flight_status()
+            self._last_status = (None, None)
+            self._last_gps = None
 
         self.parent.after(0, clear_params)
 
 
-    def _update_parameter_store(self, data):
-        """Update canonical parameter store from any Arduino response."""
-        # Track parameter changes with history entries
-        # Motor Run Time patterns: "[INFO] Motor Run Time: 20 seconds" or "[OK] Motor Run Time = 12 seconds"
-        motor_time_match = re.search(r'Motor Run Time[:\s=]+(\d+)', data, re.IGNORECASE)
-        if motor_time_match:
-            new_value = int(motor_time_match.group(1))
-            if self.current_flight_params['motor_run_time'] != new_value:
-                if re.search(r'\[OK\]', data):  # Only log when set, not when read
-                    self._add_history_entry("PARAM", f"Motor run time set to {new_value} seconds")
-                self.current_flight_params['motor_run_time'] = new_value
-
-        # Total Flight Time patterns: "[INFO] Total Flight Time: 120 seconds"
-        flight_time_match = re.search(r'Total Flight Time[:\s=]+(\d+)', data, re.IGNORECASE)
-        if flight_time_match:
-            new_value = int(flight_time_match.group(1))
-            if self.current_flight_params['total_flight_time'] != new_value:
-                if re.search(r'\[OK\]', data):  # Only log when set, not when read
-                    self._add_history_entry("PARAM", f"Total flight time set to {new_value} seconds")
-                self.current_flight_params['total_flight_time'] = new_value
-
-        # Motor Speed patterns: "[INFO] Motor Speed: 150 (1500us PWM)" or "[OK] Motor Speed = 135"
-        motor_speed_match = re.search(r'Motor Speed[:\s=]+(\d+)', data, re.IGNORECASE)
-        if motor_speed_match:
-            new_value = int(motor_speed_match.group(1))
-            if self.current_flight_params['motor_speed'] != new_value:
-                if re.search(r'\[OK\]', data):  # Only log when set, not when read
-                    self._add_history_entry("PARAM", f"Motor speed set to {new_value}")
-                self.current_flight_params['motor_speed'] = new_value
-
-        # DT Retracted patterns: "[INFO] DT Retracted: 1000us" or "[OK] DT Retracted = 1000"
-        dt_retracted_match = re.search(r'DT Retracted[:\s=]+(\d+)', data, re.IGNORECASE)
-        if dt_retracted_match:
-            self.current_flight_params['dt_retracted'] = int(dt_retracted_match.group(1))
-
-        # DT Deployed patterns: "[INFO] DT Deployed: 2000us" or "[OK] DT Deployed = 2000"
-        dt_deployed_match = re.search(r'DT Deployed[:\s=]+(\d+)', data, re.IGNORECASE)
-        if dt_deployed_match:
-            self.current_flight_params['dt_deployed'] = int(dt_deployed_match.group(1))
-
-        # DT Dwell patterns: "[INFO] DT Dwell: 5 seconds" or "[OK] DT Dwell = 5"
-        dt_dwell_match = re.search(r'DT Dwell[:\s=]+(\d+)', data, re.IGNORECASE)
-        if dt_dwell_match:
-            self.current_flight_params['dt_dwell'] = int(dt_dwell_match.group(1))
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_line(data_lower):
+        """Classify one lowercased Arduino response into the fields the parameter store uses.
+
+        Pure function of the line text, so the firmware's frequently repeated
+        status lines are parsed once and then served from the cache.
+        """
+        # Parameter reports/confirmations
+        is_set = "[ok]" in data_lower
+        params = tuple(
+            FlightSequencerTab._PARAM_SPEC[match.group('key')] + (int(match.group('val')),)
+            for match in _PARAM_RE.finditer(data_lower)
+        )
 
         # Current Phase patterns: "[INFO] Current Phase: READY" or state transition messages
-        phase_match = re.search(r'Current Phase:\s*([A-Z_]+)', data, re.IGNORECASE)
-        new_phase = None
+        phase_match = _PHASE_RE.search(data_lower)
+        phase = None
 
         if phase_match:
-            new_phase = phase_match.group(1).upper()
+            phase = phase_match.group(1).upper()
         else:
-            # State transition messages
-            if re.search(r'System ready|ready for new flight', data, re.IGNORECASE):
-                new_phase = 'READY'
-            elif re.search(r'System ARMED', data, re.IGNORECASE):
-                new_phase = 'ARMED'
-            elif re.search(r'LAUNCH.*Motor|Motor spooling', data, re.IGNORECASE):
-                new_phase = 'MOTOR_SPOOL'
-            elif re.search(r'Motor at flight speed', data, re.IGNORECASE):
-                new_phase = 'MOTOR_RUN'
-            elif re.search(r'Motor.*complete.*glide', data, re.IGNORECASE):
-                new_phase = 'GLIDE'
-            elif re.search(r'deploying DT|Flight time complete', data, re.IGNORECASE):
-                new_phase = 'DT_DEPLOY'
-            elif re.search(r'Dethermalizer DEPLOYED', data, re.IGNORECASE):
-                new_phase = 'DT_DEPLOYED'
-            elif re.search(r'flight complete', data, re.IGNORECASE):
-                new_phase = 'LANDING'
+            # State transition messages - plain substring scan, most lines match nothing
+            for keywords, candidate in FlightSequencerTab._PHASE_KEYWORDS:
+                if all(keyword in data_lower for keyword in keywords):
+                    phase = candidate
+                    break
+
+        # GPS State patterns: "[INFO] GPS Status: Available" or "GPS Status: Not detected"
+        gps_state = None
+        gps_status_match = _GPS_RE.search(data_lower)
+        if gps_status_match:
+            gps_status = gps_status_match.group(1).strip()
+            if 'available' in gps_status:
+                gps_state = 'AVAILABLE'
+            elif 'not detected' in gps_status:
+                gps_state = 'NOT_DETECTED'
+            else:
+                gps_state = gps_status.upper()
+
+        # Flight timing patterns: "Flight time: 45s" or "Elapsed: 01:23"
+        timer = None
+        time_match = _TIME_RE.search(data_lower)
+        if time_match:
+            if time_match.group(1):  # Format: "45s"
+                minutes, seconds = divmod(int(time_match.group(1)), 60)
+                timer = f"{minutes:02d}:{seconds:02d}"
+            elif time_match.group(2) and time_match.group(3):  # Format: "01:23"
+                timer = f"{time_match.group(2)}:{time_match.group(3)}"
+
+        return _ParsedLine(params, is_set, phase, gps_state, timer)
+
+    def _update_parameter_store(self, data_lower):
+        """Update canonical parameter store from any (lowercased) Arduino response.
+
+        Returns True if anything shown in the GUI (store or timer) changed.
+        """
+        parsed = self._parse_line(data_lower)
+        # A parameter report always refreshes the entries, even if the value is
+        # unchanged, so "Get Parameters" overwrites unsent edits as before
+        changed = bool(parsed.params)
+
+        # Track parameter changes with history entries
+        for param, message, new_value in parsed.params:
+            if self.current_flight_params[param] != new_value:
+                if message and parsed.is_set:  # Only log when set, not when read
+                    self._add_history_entry("PARAM", message.format(new_value))
+                self.current_flight_params[param] = new_value
 
         # Track phase changes and add to history
+        new_phase = parsed.phase
         if new_phase and new_phase != self.last_recorded_phase:
             self.current_flight_params['current_phase'] = new_phase
             self.last_recorded_phase = new_phase
+            changed = True
 
             # Add history entry for phase change
-            phase_descriptions = {
-                'READY': 'System ready for new flight',
-                'ARMED': 'System armed, ready for launch',
-                'MOTOR_SPOOL': 'Motor spooling up for launch',
-                'MOTOR_RUN': 'Motor running at flight speed',
-                'GLIDE': 'Motor complete, entering glide phase',
-                'DT_DEPLOY': 'Deploying dethermalizer',
-                'DT_DEPLOYED': 'Dethermalizer deployed',
-                'LANDING': 'Flight complete, landing phase'
-            }
-
-            description = phase_descriptions.get(new_phase, f"Phase changed to {new_phase}")
+            description = self._PHASE_DESCRIPTIONS.get(new_phase, f"Phase changed to {new_phase}")
             self._add_history_entry("PHASE", description)
 
-        # GPS State patterns: "[INFO] GPS Status: Available" or "GPS Status: Not detected"
-        gps_status_match = re.search(r'GPS Status:\s*([^()\n]+)', data, re.IGNORECASE)
-        if gps_status_match:
-            gps_status = gps_status_match.group(1).strip()
-            new_gps_state = None
+        # Track GPS state changes
+        new_gps_state = parsed.gps_state
+        if new_gps_state is not None and new_gps_state != self.current_flight_params['gps_state']:
+            description = self._GPS_DESCRIPTIONS.get(new_gps_state, f"GPS status: {new_gps_state}")
+            self._add_history_entry("GPS", description)
+            self.current_flight_params['gps_state'] = new_gps_state
+            changed = True
 
-            if 'available' in gps_status.lower():
-                new_gps_state = 'AVAILABLE'
-            elif 'not detected' in gps_status.lower():
-                new_gps_state = 'NOT_DETECTED'
-            else:
-                new_gps_state = gps_status.upper()
-
-            # Track GPS state changes
-            if new_gps_state != self.current_flight_params['gps_state']:
-                gps_descriptions = {
-                    'AVAILABLE': 'GPS module detected and available',
-                    'NOT_DETECTED': 'GPS module not detected'
-                }
-                description = gps_descriptions.get(new_gps_state, f"GPS status: {new_gps_state}")
-                self._add_history_entry("GPS", description)
-                self.current_flight_params['gps_state'] = new_gps_state
+        if parsed.timer is not None and parsed.timer != self.current_timer:
+            self.current_timer = parsed.timer
+            changed = True
 
-        # Flight timing patterns: "Flight time: 45s" or "Elapsed: 01:23"
-        time_match = re.search(r'(?:Flight time|Elapsed):\s*(?:(\d+)s|(\d+):(\d+))', data, re.IGNORECASE)
-        if time_match:
-            if time_match.group(1):  # Format: "45s"
-                seconds = int(time_match.group(1))
-                minutes = seconds // 60
-                seconds = seconds % 60
-                self.current_timer = f"{minutes:02d}:{seconds:02d}"
-            elif time_match.group(2) and time_match.group(3):  # Format: "01:23"
-                self.current_timer = f"{time_match.group(2)}:{time_match.group(3)}"
+        return changed
 
     def _sync_gui_with_parameters(self):
+        """Schedule a GUI update from the canonical parameter store."""
+        # Coalesce: one pending idle callback covers every line received before it runs
+        if self._sync_pending:
+            return
+        self._sync_pending = True
+        self.parent.after_idle(self._do_sync)
+
+    def _do_sync(self):
         """Update GUI fields to match canonical parameter store."""
-        def update_gui():
-            params = self.current_flight_params
+        self._sync_pending = False
+        params = self.current_flight_params
 
-            # Update input fields with current parameter values
-            if params['motor_run_time'] is not None:
-                self.motor_time_var.set(str(params['motor_run_time']))
+        # Update input fields with current parameter values
+        if params['motor_run_time'] is not None:
+            self._set_var(self.motor_time_var, str(params['motor_run_time']))
 
-            if params['total_flight_time'] is not None:
-                self.flight_time_var.set(str(params['total_flight_time']))
+        if params['total_flight_time'] is not None:
+            self._set_var(self.flight_time_var, str(params['total_flight_time']))
 
-            if params['motor_speed'] is not None:
-                self.motor_speed_var.set(str(params['motor_speed']))
+        if params['motor_speed'] is not None:
+            self._set_var(self.motor_speed_var, str(params['motor_speed']))
 
-            if params['dt_retracted'] is not None:
-                self.dt_retracted_var.set(str(params['dt_retracted']))
+        if params['dt_retracted'] is not None:
+            self._set_var(self.dt_retracted_var, str(params['dt_retracted']))
 
-            if params['dt_deployed'] is not None:
-                self.dt_deployed_var.set(str(params['dt_deployed']))
+        if params['dt_deployed'] is not None:
+            self._set_var(self.dt_deployed_var, str(params['dt_deployed']))
 
-            if params['dt_dwell'] is not None:
-                self.dt_dwell_var.set(str(params['dt_dwell']))
+        if params['dt_dwell'] is not None:
+            self._set_var(self.dt_dwell_var, str(params['dt_dwell']))
 
-            # Update main GUI status bar with phase and timer information
-            if self.main_gui:
-                self.main_gui.update_flight_status(
-                    phase=params['current_phase'],
-                    timer=self.current_timer
-                )
+        # Update main GUI status bar with phase and timer information
+        status = (params['current_phase'], self.current_timer)
+        if self.main_gui and status != self._last_status:
+            self.main_gui.update_flight_status(phase=status[0], timer=status[1])
+            self._last_status = status
 
-            # Update GPS status display
+        # Update GPS status display
+        if params['gps_state'] != self._last_gps:
             self.gps_status_var.set(f"GPS: {params['gps_state']}")
+            self._last_gps = params['gps_state']
+
+    @staticmethod
+    def _set_var(var, value):
+        """Set a Tk variable only if its value changed (avoids trace and redraw)."""
+        if var.get() != value:
+            var.set(value)
+
+    @property
+    def downloading_data(self):
+        """True while a flight data download is in progress."""
+        return self._dl_state in (_DownloadState.WAITING_HEADER, _DownloadState.STREAMING)
+
+    def _arm_download_watchdog(self, delay_ms):
+        """(Re)start the download watchdog, replacing any pending one."""
+        if self._dl_watchdog_id is not None:
+            self.parent.after_cancel(self._dl_watchdog_id)
+        self._dl_watchdog_id = self.parent.after(delay_ms, self._download_timeout)
+
+    def _finish_download(self, hide_progress=True):
+        """Leave the download state and (unless told not to) hide the progress bar."""
+        self._dl_state = _DownloadState.DONE
+        if self._dl_watchdog_id is not None:
+            self.parent.after_cancel(self._dl_watchdog_id)
+            self._dl_watchdog_id = None
+        if hide_progress:
+            self.dl_progress.stop()
+            self.dl_progress.pack_forget()
+
+    def _finalize_download(self):
+        """Hide the progress bar and process the completed download in one idle pass."""
+        self.dl_progress.stop()
+        self.dl_progress.pack_forget()
+        self._process_downloaded_data()
 
-        self.parent.after(0, update_gui)
-
-            
     def _download_flight_data(self):
         """Download flight records from Arduino."""
         if not self.serial_monitor or not self.serial_monitor.is_connected:
             messagebox.showwarning("Not Connected", "Please connect to Arduino first")
             return
+        if self.downloading_data:
+            return  # Already in progress
 
-        # Show progress dialog
-        progress_window = tk.Toplevel(self.parent)
-        progress_window.title("Downloading Flight Data")
-        progress_window.geometry("300x100")
-        progress_window.grab_set()  # Make it modal
-
-        ttk.Label(progress_window, text="Downloading flight records...").pack(pady=10)
-        progress = ttk.Progressbar(progress_window, mode='indeterminate')
-        progress.pack(padx=20, pady=10, fill='x')
-        progress.start()
+        # Show inline progress; the rest of the GUI stays usable meanwhile
+        self.dl_progress.pack(fill='x', padx=5, pady=2)
+        self.dl_progress.start(50)
 
         # Start download
-        self.flight_data_buffer = ""
-        self.downloading_data = True
-        self.progress_window = progress_window
+        self.flight_data_buffer.clear()
+        self._dl_state = _DownloadState.WAITING_HEADER
         self._send_command("D J")  # Request JSON format
 
-        # Set timeout for download
-        self.parent.after(10000, lambda: self._download_timeout())
+        # Completion is signalled by the END marker; this only catches no answer
+        self._arm_download_watchdog(self._DL_START_TIMEOUT_MS)
 
     def _download_timeout(self):
         """Handle download timeout."""
+        self._dl_watchdog_id = None
         if self.downloading_data:
-            self.downloading_data = False
-            if hasattr(self, 'progress_window'):
-                self.progress_window.destroy()
+            self._finish_download()
             messagebox.showerror("Timeout", "Download timed out. Please try again.")
 
     def _clear_flight_records(self):
@@ -689,7 +903,7 @@ class FlightSequencerTab:
 
     def _view_flight_path(self):
         """Open flight path visualization window."""
-        if not hasattr(self, 'last_flight_data') or not self.last_flight_data:
+        if not self.last_flight_data:
             # No current data available, offer to load from file
             response = messagebox.askyesno(
                 "No Flight Data",
@@ -698,44 +912,41 @@ class FlightSequencerTab:
             if response:
                 self._load_flight_data_from_file()
                 # Check if data was successfully loaded
-                if not hasattr(self, 'last_flight_data') or not self.last_flight_data:
+                if not self.last_flight_data:
                     return  # User cancelled or file load failed
             else:
                 return  # User chose not to load file
 
         self._create_flight_path_window()
 
-    def _handle_flight_data_response(self, data):
+    def _handle_flight_data_response(self, data, data_lower):
         """Handle flight data download response."""
         if not self.downloading_data:
             # Update GPS status from help command responses
-            if "GPS Status:" in data:
-                if "Available" in data:
+            if "gps status:" in data_lower:
+                if "available" in data_lower:
                     # Extract position count
-                    import re
-                    match = re.search(r'\((\d+) positions recorded\)', data)
+                    match = _POS_COUNT_RE.search(data_lower)
                     if match:
                         count = match.group(1)
                         self.gps_status_var.set(f"GPS: Available")
                         self.records_status_var.set(f"Records: {count} positions")
                     else:
                         self.gps_status_var.set("GPS: Available")
-                elif "Not detected" in data:
+                elif "not detected" in data_lower:
                     self.gps_status_var.set("GPS: Not detected")
                     self.records_status_var.set("Records: N/A (No GPS)")
             return
 
         # Check for "no data available" response - cancel download immediately
-        if "No flight records available" in data:
-            self.downloading_data = False
-            if hasattr(self, 'progress_window'):
-                self.progress_window.destroy()
+        if "no flight records available" in data_lower:
+            self._finish_download()
 
             # Show appropriate message based on reason
-            if "GPS not available" in data:
+            if "gps not available" in data_lower:
                 messagebox.showinfo("No Data", "No flight records available:\nGPS module not detected.")
                 self.records_status_var.set("Records: N/A (No GPS)")
-            elif "GPS detected but no positions recorded" in data:
+            elif "gps detected but no positions recorded" in data_lower:
                 messagebox.showinfo("No Data", "No flight records available:\nGPS detected but no flight data recorded yet.")
                 self.records_status_var.set("Records: 0 positions")
             else:
@@ -744,84 +955,73 @@ class FlightSequencerTab:
             return
 
         # Collect data until END marker
-        self.flight_data_buffer += data + "\n"
+        self.flight_data_buffer.append(data)
 
         if "[END_FLIGHT_DATA]" in data:
-            self.downloading_data = False
-            if hasattr(self, 'progress_window'):
-                self.progress_window.destroy()
-            self._process_downloaded_data()
+            # Stop collecting now; hiding the progress bar and parsing share one
+            # idle callback so Tk repaints once, after both
+            self._finish_download(hide_progress=False)
+            self.parent.after_idle(self._finalize_download)
+            return
+
+        if self._dl_state is _DownloadState.WAITING_HEADER and "[START_FLIGHT_DATA]" in data:
+            self._dl_state = _DownloadState.STREAMING
+
+        # While records stream in, only a stalled link ends the download early;
+        # the inactivity window scales with however many records are sent
+        if self._dl_state is _DownloadState.STREAMING:
+            self._arm_download_watchdog(self._DL_IDLE_TIMEOUT_MS)
+
+    @staticmethod
+    def _iter_download_rows(buffer_text):
+        """Yield the data rows of a download, rejoining GPS records split across lines.
+
+        Empty lines and control markers are dropped. Any line ending is
+        accepted, and a GPS fragment is joined with the line after it when
+        that completes the record.
+        """
+        lines = iter(buffer_text.splitlines())
+        lookahead = None
+        while True:
+            if lookahead is not None:
+                line, lookahead = lookahead, None
+            else:
+                line = next(lines, None)
+                if line is None:
+                    return
+            line = line.strip()
+
+            # Skip empty lines and control markers
+            if not line or line.startswith(('[', 'DEBUG')):
+                continue
+
+            # One regex match verifies every GPS field is present
+            if line.startswith('GPS,') and not _GPS_ROW_RE.match(line):
+                following = next(lines, None)
+                if following is not None:
+                    merged_line = line + following.strip()
+                    if _GPS_ROW_RE.match(merged_line):
+                        yield merged_line
+                        continue
+                    lookahead = following  # Not a continuation; handle it normally
+
+            yield line
 
     def _process_downloaded_data(self):
         """Process and save downloaded flight data."""
-        try:
-            # Parse CSV format from buffer - handle line breaks within records
-            raw_data = self.flight_data_buffer.strip()
-
-            # Remove carriage returns and normalize line endings
-            raw_data = raw_data.replace('\r\n', '\n').replace('\r', '\n')
-
-            # Reassemble any records that were split across lines
-            # Look for incomplete GPS records and join them with the next line
-            lines = raw_data.split('\n')
-            processed_lines = []
-            i = 0
-
-            while i < len(lines):
-                line = lines[i].strip()
-
-                # Skip empty lines and control markers
-                if not line or line.startswith('[') or line.startswith('DEBUG'):
-                    i += 1
-                    continue
-
-                # Check if this is an incomplete GPS record
-                if line.startswith('GPS,'):
-                    parts = line.split(',')
-
-                    # GPS records need 6 parts: GPS,timestamp,state,state_name,lat,lon
-                    # Also check if lat/lon fields look incomplete (contain only minus sign)
-                    is_incomplete = False
-
-                    if len(parts) < 6:
-                        is_incomplete = True
-                    elif len(parts) >= 6:
-                        # Check if latitude or longitude fields are incomplete
-                        lat_field = parts[4] if len(parts) > 4 else ""
-                        lon_field = parts[5] if len(parts) > 5 else ""
-
-                        # Check for incomplete coordinate values (just a minus sign or empty)
-                        if lat_field in ["-", ""] or lon_field in ["-", ""]:
-                            is_incomplete = True
-
-                    if is_incomplete:
-                        # This GPS record is incomplete, try to merge with next line
-                        if i + 1 < len(lines):
-                            next_line = lines[i + 1].strip()
-                            # Merge the lines
-                            merged_line = line + next_line
-                            processed_lines.append(merged_line)
-                            i += 2  # Skip both current and next line
-                        else:
-                            # Last line, can't merge
-                            processed_lines.append(line)
-                            i += 1
-                    else:
-                        # Complete GPS record
-                        processed_lines.append(line)
-                        i += 1
-                else:
-                    # Non-GPS line (HEADER, etc.)
-                    processed_lines.append(line)
-                    i += 1
+        # Join the received chunks once; they are raw slices of the serial stream
+        buffer_text = "".join(self.flight_data_buffer)
 
+        try:
             flight_header = None
             gps_records = []
+            add_record = gps_records.append  # Bound once for the per-record loop
 
-            for line in processed_lines:
-                if line.startswith('HEADER,'):
+            # Single pass: rows are reassembled lazily and split by the C csv
+            # reader, with no normalised copy of the buffer or row lists
+            for parts in csv.reader(self._iter_download_rows(buffer_text)):
+                if parts[0] == 'HEADER':
                     # Parse header: HEADER,flight_id,duration_ms,gps_available,position_count,motor_run_time,total_flight_time,motor_speed
-                    parts = line.split(',')
                     if len(parts) >= 8:
                         flight_header = {
                             'flight_id': parts[1],
@@ -834,41 +1034,34 @@ class FlightSequencerTab:
                                 'motor_speed': int(parts[7])
                             }
                         }
-                elif line.startswith('GPS,'):
-                    # Parse GPS record: GPS,timestamp_ms,flight_state,state_name,latitude,longitude,altitude
-                    parts = line.split(',')
-                    if len(parts) >= 7:
-                        try:
-                            altitude_val = float(parts[6])
-                            gps_records.append({
-                                'timestamp_ms': int(parts[1]),
-                                'flight_state': int(parts[2]),
-                                'state_name': parts[3],
-                                'latitude': float(parts[4]),
-                                'longitude': float(parts[5]),
-                                'altitude': altitude_val
-                            })
-                            # Debug: Print first few altitude values to help diagnose
-                            if len(gps_records) <= 3:
-                                print(f"[DEBUG] GPS record {len(gps_records)}: Alt={altitude_val}m, Raw parts: {parts[:7]}")
-                        except (ValueError, IndexError) as e:
-                            # Handle parsing errors gracefully
-                            continue
-                    elif len(parts) >= 6:
-                        # Fallback for older format without altitude
-                        try:
-                            gps_records.append({
-                                'timestamp_ms': int(parts[1]),
-                                'flight_state': int(parts[2]),
-                                'state_name': parts[3],
-                                'latitude': float(parts[4]),
-                                'longitude': float(parts[5]),
-                                'altitude': 0.0  # Default altitude if not available
-                            })
-                        except ValueError as ve:
-                            # Log problematic GPS record but continue processing
-                            print(f"Skipping malformed GPS record: {line} - Error: {ve}")
-                            continue
+                    continue
+                if parts[0] != 'GPS':
+                    continue
+
+                # Parse GPS record: GPS,timestamp_ms,flight_state,state_name,latitude,longitude,altitude
+                if len(parts) >= 7:
+                    try:
+                        altitude_val = float(parts[6])
+                        add_record(_GpsRecord(int(parts[1]), int(parts[2]), parts[3],
+                                              float(parts[4]), float(parts[5]), altitude_val))
+                        # Debug: Log first few altitude values to help diagnose
+                        if len(gps_records) <= 3:
+                            logger.debug("GPS record %d: Alt=%sm, Raw parts: %s",
+                                         len(gps_records), altitude_val, parts[:7])
+                    except (ValueError, IndexError) as e:
+                        # Handle parsing errors gracefully
+                        continue
+                elif len(parts) >= 6:
+                    # Fallback for older format without altitude
+                    try:
+                        add_record(_GpsRecord(int(parts[1]), int(parts[2]), parts[3],
+                                              float(parts[4]), float(parts[5]),
+                                              0.0))  # Default altitude if not available
+                    except ValueError as ve:
+                        # Log problematic GPS record but continue processing
+                        logger.warning("Skipping malformed GPS record: %s - Error: %s",
+                                       ','.join(parts), ve)
+                        continue
 
             if flight_header and gps_records:
                 # Create flight data structure
@@ -878,31 +1071,20 @@ class FlightSequencerTab:
                 }
 
                 self.last_flight_data = flight_data
+                compact_json = len(gps_records) > self._JSON_COMPACT_RECORDS
 
                 # Save to file in ./flightdata directory
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"flight_data_{timestamp}.json"
-
-                # Create flightdata directory if it doesn't exist
-                flightdata_dir = os.path.join(os.getcwd(), "flightdata")
-                os.makedirs(flightdata_dir, exist_ok=True)
+                initial_file_path = self._default_save_path("flight_data", ".json")
 
                 try:
-                    # Combine directory and filename for initialfile
-                    initial_file_path = os.path.join(flightdata_dir, filename)
-
-                    file_path = filedialog.asksaveasfilename(
-                        defaultextension=".json",
-                        filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-                        initialfile=initial_file_path,
-                        parent=self.parent,
-                        title="Save Flight Data"
-                    )
+                    file_path = self._ask_save(initial_file_path, "JSON", "Save Flight Data")
 
                     if file_path:
-                        # User selected a file location
-                        with open(file_path, 'w') as f:
-                            json.dump(flight_data, f, indent=2)
+                        # User selected a file location; write without blocking the GUI
+                        self._run_in_background(
+                            lambda: self._dump_json(file_path, self._flight_data_to_json(flight_data),
+                                                    compact=compact_json),
+                            error_message="Failed to save flight data")
                         # File saved successfully - no message needed
                     else:
                         # User cancelled - don't save anything
@@ -910,9 +1092,9 @@ class FlightSequencerTab:
 
                 except Exception as dialog_error:
                     # Fallback: save to flightdata directory with timestamp
-                    fallback_path = os.path.join(flightdata_dir, filename)
-                    with open(fallback_path, 'w') as f:
-                        json.dump(flight_data, f, indent=2)
+                    fallback_path = initial_file_path
+                    self._dump_json(fallback_path, self._flight_data_to_json(flight_data),
+                                    compact=compact_json)
                     messagebox.showinfo("Success", f"Flight data saved to:\n{fallback_path}\n\n(File dialog error: {str(dialog_error)})")
 
                 # Update status
@@ -928,11 +1110,71 @@ class FlightSequencerTab:
             debug_file = f"debug_csv_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
             with open(debug_file, 'w') as f:
                 f.write("Raw buffer:\n")
-                f.write(repr(self.flight_data_buffer))
+                f.write(repr(buffer_text))
                 f.write(f"\n\nParse Error: {str(e)}")
 
             messagebox.showerror("Parse Error", f"Failed to process flight data:\n{str(e)}\n\nDebug data saved to: {debug_file}")
 
+    def _default_save_path(self, prefix, extension, directory=None, timestamp=None):
+        """Timestamped default path for a save dialog, in ./flightdata unless given.
+
+        The directory is created the first time it is used in a session.
+        """
+        directory = directory or self._flightdata_dir
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        return os.path.join(directory, f"{prefix}_{timestamp}{extension}")
+
+    def _ask_save(self, initial_file_path, type_name, title, parent=None):
+        """Show a save dialog for one file type; returns '' if cancelled."""
+        extension = os.path.splitext(initial_file_path)[1]
+        return filedialog.asksaveasfilename(
+            defaultextension=extension,
+            filetypes=[(f"{type_name} files", f"*{extension}"), ("All files", "*.*")],
+            initialfile=initial_file_path,
+            parent=parent or self.parent,
+            title=title
+        )
+
+    def _run_in_background(self, work, on_done=None, error_message="Failed to save file"):
+        """Run blocking file I/O on the I/O worker and report back on the Tk thread."""
+        def report(future):
+            error = future.exception()
+            if error is not None:
+                self.parent.after(0, lambda: messagebox.showerror("Error", f"{error_message}:\n{error}"))
+            elif on_done is not None:
+                self.parent.after(0, on_done)
+
+        self._io_executor.submit(work).add_done_callback(report)
+
+    @staticmethod
+    def _dump_json(file_path, data, compact=False):
+        """Write data to a JSON file, indented unless compact is requested.
+
+        Uses orjson when it is installed, otherwise the standard json module.
+        """
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w') as f:
+                if compact:
+                    json.dump(data, f, separators=(',', ':'))
+                else:
+                    json.dump(data, f, indent=2)
+
+    @staticmethod
+    def _load_json(file_path):
+        """Read a JSON file, with orjson when it is installed.
+
+        Decode errors are json.JSONDecodeError either way (orjson's subclasses it).
+        """
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
     def _create_flight_path_window(self):
         """Create flight path visualization window."""
         try:
@@ -978,28 +1220,51 @@ class FlightSequencerTab:
             ttk.Label(viz_window, text="No position data available").pack()
             return
 
-        # Extract data arrays
-        times = [p['timestamp_ms'] / 1000.0 for p in positions]  # Convert to seconds
-        lats = [p['latitude'] for p in positions]
-        lons = [p['longitude'] for p in positions]
-        alts = [p.get('altitude', 0.0) for p in positions]  # Get altitude with fallback
-        states = [p['flight_state'] for p in positions]
-        state_names = [p['state_name'] for p in positions]
-
-        # Debug: Print altitude statistics
-        if alts:
-            min_alt, max_alt = min(alts), max(alts)
-            avg_alt = sum(alts) / len(alts)
-            non_zero_alts = [a for a in alts if a != 0.0]
-            print(f"[DEBUG] Altitude data: {len(positions)} points, Range: {min_alt:.1f}-{max_alt:.1f}m, Avg: {avg_alt:.1f}m, Non-zero: {len(non_zero_alts)}")
-            if len(non_zero_alts) > 0:
-                print(f"[DEBUG] First 5 altitudes: {alts[:5]}")
+        # Extract data arrays in one pass into a structured array. Position
+        # columns stay float64: float32 latitude/longitude steps are ~0.5 m,
+        # which visibly quantizes a small model's track, and matplotlib
+        # transforms paths in float64 anyway. Time (ms) and state stay compact.
+        # The array and its altitude stats are kept on last_flight_data, so
+        # reopening the window reuses them; a new download or file load
+        # replaces last_flight_data and with it the cache.
+        track = self.last_flight_data.get('_track')
+        if track is None:
+            track = np.array(
+                [(p.timestamp_ms, p.flight_state, p.latitude, p.longitude, p.altitude) for p in positions],
+                dtype=[('t', 'f4'), ('s', 'i1'), ('lat', 'f8'), ('lon', 'f8'), ('alt', 'f8')])
+            alt_column = track['alt']
+            self.last_flight_data['_track'] = track
+            self.last_flight_data['_stats'] = {
+                'alt_min': alt_column.min(),
+                'alt_max': alt_column.max(),
+                'alt_mean': alt_column.mean(),
+                'alt_nonzero': np.count_nonzero(alt_column)
+            }
+        stats = self.last_flight_data['_stats']
+        times = track['t'] / np.float32(1000.0)  # Convert to seconds
+        lats = track['lat']
+        lons = track['lon']
+        alts = track['alt']
+        states = track['s']
+
+        # Debug: Log altitude statistics
+        if len(alts) and logger.isEnabledFor(logging.DEBUG):
+            min_alt, max_alt = stats['alt_min'], stats['alt_max']
+            avg_alt = stats['alt_mean']
+            non_zero_count = stats['alt_nonzero']
+            logger.debug("Altitude data: %d points, Range: %.1f-%.1fm, Avg: %.1fm, Non-zero: %d",
+                         len(positions), min_alt, max_alt, avg_alt, non_zero_count)
+            if non_zero_count > 0:
+                logger.debug("First 5 altitudes: %s", alts[:5].tolist())
             else:
-                print(f"[DEBUG] WARNING: All altitude values are zero! Check GPS data source.")
-
-        # Plot 1: Flight path map
-        scatter = ax1.scatter(lons, lats, c=times, cmap='viridis', s=50)
-        ax1.plot(lons, lats, 'b-', alpha=0.6, linewidth=2)
+                logger.debug("All altitude values are zero! Check GPS data source.")
+
+        # Plot 1: Flight path map. Dense point artists are rasterized so PNG/PDF
+        # saves render them as one image instead of thousands of vector glyphs.
+        stride = max(1, len(times) // self._PLOT_MAX_SCATTER_POINTS)
+        scatter = ax1.scatter(lons[::stride], lats[::stride], c=times[::stride], cmap='viridis', s=50,
+                              rasterized=True)
+        ax1.plot(lons, lats, 'b-', alpha=0.6, linewidth=2, rasterized=True)
         ax1.set_xlabel('Longitude')
         ax1.set_ylabel('Latitude')
         ax1.set_title('GPS Flight Path')
@@ -1013,16 +1278,15 @@ class FlightSequencerTab:
         state_labels = {3: 'Spool', 4: 'Motor', 5: 'Glide', 6: 'DT Deploy', 7: 'Post-DT'}
 
         for state in state_colors:
-            state_positions = [(lon, lat) for lon, lat, s in zip(lons, lats, states) if s == state]
-            if state_positions:
-                state_lons, state_lats = zip(*state_positions)
-                ax1.scatter(state_lons, state_lats, c=state_colors[state],
+            mask = states == state
+            if mask.any():
+                ax1.scatter(lons[mask], lats[mask], c=state_colors[state],
                            s=100, alpha=0.7, marker='s', label=state_labels[state])
 
         ax1.legend()
 
         # Plot 2: Altitude over time
-        ax2.plot(times, alts, 'g-', linewidth=2, marker='o', markersize=4)
+        ax2.plot(times, alts, 'g-', linewidth=2, marker='o', markersize=4, rasterized=True)
         ax2.set_xlabel('Time (seconds)')
         ax2.set_ylabel('Altitude (meters)')
         ax2.set_title('Altitude Over Time')
@@ -1030,20 +1294,15 @@ class FlightSequencerTab:
 
         # Add state background colors to altitude plot
         state_colors = {3: 'red', 4: 'orange', 5: 'lightgreen', 6: 'purple', 7: 'lightblue'}
-        current_state = None
-        state_start_time = None
-
-        for i, (time, state) in enumerate(zip(times, states)):
-            if state != current_state:
-                if current_state is not None and current_state in state_colors:
-                    # Fill previous state period
-                    ax2.axvspan(state_start_time, time, alpha=0.2, color=state_colors[current_state])
-                current_state = state
-                state_start_time = time
-
-        # Fill last state period
-        if current_state is not None and current_state in state_colors and times:
-            ax2.axvspan(state_start_time, times[-1], alpha=0.2, color=state_colors[current_state])
+        # Each state period runs from its first point to the first point of the
+        # next period (the last one to the final point); only the transitions
+        # are visited, not every point
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(states)) + 1))
+        ends = np.append(starts[1:], len(states) - 1)
+        for start, end in zip(starts, ends):
+            state = int(states[start])
+            if state in state_colors:
+                ax2.axvspan(times[start], times[end], alpha=0.2, color=state_colors[state])
 
         # Add legend for state colors
         state_labels = {3: 'Motor Spool', 4: 'Motor Run', 5: 'Glide', 6: 'DT Deploy', 7: 'Post-DT'}
@@ -1052,6 +1311,8 @@ class FlightSequencerTab:
         if legend_elements:
             ax2.legend(handles=legend_elements, loc='upper right')
 
+        # Margins are fixed here, so saves can skip bbox_inches='tight' and its
+        # extra measuring render
         plt.tight_layout()
 
         # Store figure reference for saving
@@ -1079,45 +1340,33 @@ class FlightSequencerTab:
 
     def _export_csv(self):
         """Export flight data to CSV format."""
-        if not hasattr(self, 'last_flight_data') or not self.last_flight_data:
+        if not self.last_flight_data:
             messagebox.showwarning("No Data", "No flight data to export")
             return
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"flight_path_{timestamp}.csv"
-
-        # Create flightdata directory if it doesn't exist
-        flightdata_dir = os.path.join(os.getcwd(), "flightdata")
-        os.makedirs(flightdata_dir, exist_ok=True)
-
-        # Combine directory and filename for initialfile
-        initial_file_path = os.path.join(flightdata_dir, filename)
-
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-            initialfile=initial_file_path,
-            parent=self.parent,
-            title="Export Flight Path as CSV"
-        )
+        file_path = self._ask_save(self._default_save_path("flight_path", ".csv"),
+                                   "CSV", "Export Flight Path as CSV")
 
         if file_path:
             positions = self.last_flight_data.get('position_records', [])
 
-            with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['Time_Seconds', 'Flight_State', 'State_Name',
-                               'Latitude', 'Longitude', 'Altitude_Meters'])
-
-                for pos in positions:
-                    writer.writerow([
-                        pos['timestamp_ms'] / 1000.0,
-                        pos['flight_state'],
-                        pos['state_name'],
-                        pos['latitude'],
-                        pos['longitude'],
-                        pos.get('altitude', 0.0)
-                    ])
+            def write_csv():
+                with open(file_path, 'w', newline='') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(['Time_Seconds', 'Flight_State', 'State_Name',
+                                   'Latitude', 'Longitude', 'Altitude_Meters'])
+
+                    writer.writerows(
+                        (pos.timestamp_ms / 1000.0,
+                         pos.flight_state,
+                         pos.state_name,
+                         pos.latitude,
+                         pos.longitude,
+                         pos.altitude)
+                        for pos in positions
+                    )
+
+            self._run_in_background(write_csv, error_message="Failed to export CSV")
 
             # CSV exported successfully - no message needed
             pass
@@ -1125,32 +1374,18 @@ class FlightSequencerTab:
 
     def _export_kml(self):
         """Export flight path to KML for Google Earth."""
-        if not hasattr(self, 'last_flight_data') or not self.last_flight_data:
+        if not self.last_flight_data:
             messagebox.showwarning("No Data", "No flight data to export")
             return
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"flight_path_{timestamp}.kml"
-
-        # Create flightdata directory if it doesn't exist
-        flightdata_dir = os.path.join(os.getcwd(), "flightdata")
-        os.makedirs(flightdata_dir, exist_ok=True)
-
-        # Combine directory and filename for initialfile
-        initial_file_path = os.path.join(flightdata_dir, filename)
-
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".kml",
-            filetypes=[("KML files", "*.kml"), ("All files", "*.*")],
-            initialfile=initial_file_path,
-            parent=self.parent,
-            title="Export Flight Path as KML"
-        )
+        file_path = self._ask_save(self._default_save_path("flight_path", ".kml", timestamp=timestamp),
+                                   "KML", "Export Flight Path as KML")
 
         if file_path:
             positions = self.last_flight_data.get('position_records', [])
 
-            kml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
+            kml_header = f"""<?xml version="1.0" encoding="UTF-8"?>
 <kml xmlns="http://www.opengis.net/kml/2.2">
   <Document>
     <name>Flight Path {timestamp}</name>
@@ -1170,85 +1405,132 @@ class FlightSequencerTab:
         <coordinates>
 """
 
-            for pos in positions:
-                alt = pos.get('altitude', 0.0)
-                kml_content += f"          {pos['longitude']},{pos['latitude']},{alt}\n"
+            # Format the whole coordinate block in one C-level % pass (np.savetxt
+            # would be slower: it formats row by row in Python)
+            coord_values = tuple(v for pos in positions
+                                 for v in (pos.longitude, pos.latitude, pos.altitude))
+            coordinates = (self._KML_COORD_FMT * len(positions)) % coord_values
 
-            kml_content += """        </coordinates>
+            kml_footer = """        </coordinates>
       </LineString>
     </Placemark>
   </Document>
 </kml>"""
 
-            with open(file_path, 'w') as f:
-                f.write(kml_content)
+            # Write the pieces straight out rather than concatenating them first
+            def write_kml():
+                with open(file_path, 'w') as f:
+                    f.writelines((kml_header, coordinates, kml_footer))
 
-            messagebox.showinfo("Success", f"KML exported to:\n{file_path}")
+            self._run_in_background(
+                write_kml,
+                on_done=lambda: messagebox.showinfo("Success", f"KML exported to:\n{file_path}"),
+                error_message="Failed to export KML")
         else:
             messagebox.showinfo("Cancelled", "KML export cancelled by user.")
 
     def _save_plot_as_png(self):
         """Save the current plot as PNG."""
-        if not hasattr(self, 'current_figure') or self.current_figure is None:
+        if self.current_figure is None:
             messagebox.showwarning("No Plot", "No plot available to save")
             return
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"flight_plot_{timestamp}.png"
-
-        # Create flightdata directory if it doesn't exist
-        flightdata_dir = os.path.join(os.getcwd(), "flightdata")
-        os.makedirs(flightdata_dir, exist_ok=True)
-        initial_file_path = os.path.join(flightdata_dir, filename)
-
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".png",
-            filetypes=[("PNG files", "*.png"), ("All files", "*.*")],
-            initialfile=initial_file_path,
-            parent=self.current_viz_window,
-            title="Save Plot as PNG"
-        )
+        file_path = self._ask_save(self._default_save_path("flight_plot", ".png"),
+                                   "PNG", "Save Plot as PNG", parent=self.current_viz_window)
 
         if file_path:
-            try:
-                self.current_figure.savefig(file_path, dpi=300, bbox_inches='tight')
-                messagebox.showinfo("Success", f"Plot saved to:\n{file_path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save plot:\n{str(e)}")
+            self._save_figure(file_path, 'png', dpi=300)
 
     def _save_plot_as_pdf(self):
         """Save the current plot as PDF."""
-        if not hasattr(self, 'current_figure') or self.current_figure is None:
+        if self.current_figure is None:
             messagebox.showwarning("No Plot", "No plot available to save")
             return
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"flight_plot_{timestamp}.pdf"
+        file_path = self._ask_save(self._default_save_path("flight_plot", ".pdf"),
+                                   "PDF", "Save Plot as PDF", parent=self.current_viz_window)
 
-        # Create flightdata directory if it doesn't exist
-        flightdata_dir = os.path.join(os.getcwd(), "flightdata")
-        os.makedirs(flightdata_dir, exist_ok=True)
-        initial_file_path = os.path.join(flightdata_dir, filename)
+        if file_path:
+            self._save_figure(file_path, 'pdf')
 
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".pdf",
-            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
-            initialfile=initial_file_path,
-            parent=self.current_viz_window,
-            title="Save Plot as PDF"
-        )
+    def _save_figure(self, file_path, default_format, **savefig_kwargs):
+        """Render the current plot and write it to file_path in the background.
 
-        if file_path:
-            try:
-                self.current_figure.savefig(file_path, bbox_inches='tight')
-                messagebox.showinfo("Success", f"Plot saved to:\n{file_path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save plot:\n{str(e)}")
+        Matplotlib is not thread-safe and the figure is live in its Tk canvas,
+        so it is rendered here on the Tk thread; only the file write is handed
+        to the I/O worker.
+        """
+        image_format = os.path.splitext(file_path)[1][1:].lower() or default_format
+        buffer = io.BytesIO()
+        try:
+            self.current_figure.savefig(buffer, format=image_format, **savefig_kwargs)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save plot:\n{e}")
+            return
+        image = buffer.getvalue()
+
+        def write():
+            with open(file_path, 'wb') as f:
+                f.write(image)
+
+        self._run_in_background(
+            write,
+            on_done=lambda: messagebox.showinfo("Success", f"Plot saved to:\n{file_path}"),
+            error_message="Failed to save plot")
+
+    @staticmethod
+    def _flight_data_to_json(flight_data):
+        """JSON form of flight data, with position records stored column-wise."""
+        return {
+            'flight_header': flight_data['flight_header'],
+            'position_records': {
+                '_fields': list(_GpsRecord._fields),
+                'rows': [tuple(record) for record in flight_data['position_records']]
+            }
+        }
+
+    def _records_from_columns(self, columns):
+        """Build GPS records from the columnar {"_fields", "rows"} layout."""
+        fields = columns.get('_fields')
+        rows = columns.get('rows')
+        if not isinstance(fields, list) or not isinstance(rows, list):
+            raise ValueError("Position records need '_fields' and 'rows' lists")
+
+        missing_fields = [field for field in self._GPS_RECORD_FIELDS if field not in fields]
+        if missing_fields:
+            raise ValueError(f"GPS records missing required fields: {', '.join(missing_fields)}")
+        width = len(fields)
+        if not all(isinstance(row, list) and len(row) == width for row in rows):
+            raise ValueError("GPS record rows do not match the field list")
+
+        if fields == list(_GpsRecord._fields):
+            return [_GpsRecord._make(row) for row in rows]
+        # Different column order, or no altitude column (defaults to 0.0)
+        index = [fields.index(field) if field in fields else None for field in _GpsRecord._fields]
+        return [_GpsRecord._make(row[i] if i is not None else 0.0 for i in index) for row in rows]
+
+    def _records_from_objects(self, objects):
+        """Build GPS records from a list of one JSON object per record."""
+        # Validate every record's structure; the subset test against each
+        # record's keys view runs in C, so this stays cheap for long flights
+        required_fields = self._GPS_RECORD_FIELDS
+        required_set = frozenset(required_fields)
+        bad_record = next((record for record in objects
+                           if not (isinstance(record, dict) and required_set <= record.keys())),
+                          None)
+        if bad_record is not None:
+            if not isinstance(bad_record, dict):
+                raise ValueError("GPS records must be JSON objects")
+            missing_fields = [field for field in required_fields if field not in bad_record]
+            raise ValueError(f"GPS records missing required fields: {', '.join(missing_fields)}")
+
+        return [_GpsRecord(r['timestamp_ms'], r['flight_state'], r['state_name'],
+                           r['latitude'], r['longitude'], r.get('altitude', 0.0))
+                for r in objects]
 
     def _load_flight_data_from_file(self):
         """Load flight data from an existing JSON file."""
-        # Create flightdata directory reference for initial directory
-        flightdata_dir = os.path.join(os.getcwd(), "flightdata")
+        flightdata_dir = self._flightdata_dir
         initial_dir = flightdata_dir if os.path.exists(flightdata_dir) else os.getcwd()
 
         file_path = filedialog.askopenfilename(
@@ -1264,8 +1546,7 @@ class FlightSequencerTab:
             return  # User cancelled
 
         try:
-            with open(file_path, 'r') as f:
-                loaded_data = json.load(f)
+            loaded_data = self._load_json(file_path)
 
             # Validate that this is flight data (has required structure)
             if not isinstance(loaded_data, dict):
@@ -1274,23 +1555,23 @@ class FlightSequencerTab:
             if 'flight_header' not in loaded_data or 'position_records' not in loaded_data:
                 raise ValueError("File does not contain required flight data fields (flight_header, position_records)")
 
-            # Validate position records structure
+            # Validate position records structure: the columnar layout
+            # {"_fields": [...], "rows": [[...], ...]}, or a list of one object
+            # per record as written by earlier versions
             position_records = loaded_data.get('position_records', [])
-            if not isinstance(position_records, list):
+            if isinstance(position_records, dict) and '_fields' in position_records:
+                position_records = self._records_from_columns(position_records)
+            elif isinstance(position_records, list):
+                position_records = self._records_from_objects(position_records)
+            else:
                 raise ValueError("Position records must be a list")
 
             # Check if we have any position records
             if not position_records:
                 raise ValueError("No GPS position records found in file")
 
-            # Validate sample record structure
-            sample_record = position_records[0]
-            required_fields = ['timestamp_ms', 'flight_state', 'state_name', 'latitude', 'longitude']
-            missing_fields = [field for field in required_fields if field not in sample_record]
-            if missing_fields:
-                raise ValueError(f"GPS records missing required fields: {', '.join(missing_fields)}")
-
             # Data is valid, store it
+            loaded_data['position_records'] = position_records
             self.last_flight_data = loaded_data
 
             # Update UI to show loaded data info
@@ -1303,7 +1584,7 @@ class FlightSequencerTab:
                 "Flight Data Loaded",
                 f"Successfully loaded flight data from:\n{file_name}\n\n"
                 f"Records: {record_count} GPS positions\n"
-                f"Duration: {position_records[-1]['timestamp_ms'] / 1000.0:.1f} seconds"
+                f"Duration: {position_records[-1].timestamp_ms / 1000.0:.1f} seconds"
             )
 
         except json.JSONDecodeError as e:
@@ -1340,27 +1621,13 @@ class FlightSequencerTab:
             # Filter out None values for cleaner JSON
             params = {k: v for k, v in params.items() if v is not None}
 
-            # Create parameters directory if it doesn't exist
-            params_dir = os.path.join(os.getcwd(), "parameters")
-            os.makedirs(params_dir, exist_ok=True)
-
-            # Default filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_filename = f"FlightSequencer_params_{timestamp}.json"
-            initial_file_path = os.path.join(params_dir, default_filename)
-
-            # Ask user for file location
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-                initialfile=initial_file_path,
-                parent=self.parent,
-                title="Save Flight Parameters"
-            )
+            # Ask user for file location, defaulting to a timestamped name in ./parameters
+            initial_file_path = self._default_save_path("FlightSequencer_params", ".json",
+                                                        directory=self._parameters_dir)
+            file_path = self._ask_save(initial_file_path, "JSON", "Save Flight Parameters")
 
             if file_path:
-                with open(file_path, 'w') as f:
-                    json.dump(params, f, indent=2)
+                self._dump_json(file_path, params)
                 messagebox.showinfo("Success", f"Parameters saved to:\n{file_path}")
 
         except Exception as e:
@@ -1370,7 +1637,7 @@ class FlightSequencerTab:
         """Load flight parameters from a JSON file."""
         try:
             # Look in parameters directory first
-            params_dir = os.path.join(os.getcwd(), "parameters")
+            params_dir = self._parameters_dir
 
             file_path = filedialog.askopenfilename(
                 filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
@@ -1380,8 +1647,7 @@ class FlightSequencerTab:
             )
 
             if file_path:
-                with open(file_path, 'r') as f:
-                    params = json.load(f)
+                params = self._load_json(file_path)
 
                 # Validate that this is a FlightSequencer parameter file
                 if params.get('application') != 'FlightSequencer':
@@ -1413,34 +1679,78 @@ class FlightSequencerTab:
 
     def _add_history_entry(self, event_type, description):
         """Add an entry to the flight history."""
-        from datetime import datetime
+        # Skip an exact repeat of the previous entry (e.g. the same error re-reported)
+        key = (event_type, description)
+        if key == self._last_history_key:
+            return
+        self._last_history_key = key
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        entry = f"[{timestamp}] {event_type}: {description}"
+        entry = (time.strftime("%H:%M:%S"), event_type, description)
 
         # Store in history list
         self.flight_history.append(entry)
 
-        # Update the text widget
-        def update_history():
-            self.history_text.config(state='normal')
-            self.history_text.insert('end', entry + '\n')
-            self.history_text.config(state='disabled')
-            self.history_text.see('end')  # Auto-scroll to bottom
+        # Queue for the history list; one timed flush shows the whole burst
+        self._history_pending.append(entry)
+        if not self._history_flush_pending:
+            self._history_flush_pending = True
+            self.parent.after(self._HISTORY_FLUSH_MS, self._flush_history)
+
+    def _flush_history(self):
+        """Append all pending history entries to the history list."""
+        self._history_flush_pending = False
+        if self.history_tree is None:
+            # Pane not built yet; entries are replayed from flight_history when it is
+            self._history_pending.clear()
+            return
+        if not self._history_pending or not self.frame.winfo_viewable():
+            # Entries stay queued while another tab is shown; _on_map flushes them
+            return
 
-        self.parent.after(0, update_history)
+        if len(self._history_pending) == self._HISTORY_MAX_ENTRIES:
+            # Backlog would push every current row out; repopulate from flight_history
+            self._rebuild_history_list()
+            return
+
+        # Only follow new entries if the user has not scrolled up to read older ones
+        at_bottom = self.history_tree.yview()[1] >= 1.0
+
+        item = None
+        while self._history_pending:
+            item = self.history_tree.insert('', 'end', values=self._history_pending.popleft())
+            self._history_rows += 1
+
+        # Keep the widget bounded like flight_history: drop the oldest rows in one delete
+        excess = self._history_rows - self._HISTORY_MAX_ENTRIES
+        if excess > 0:
+            self.history_tree.delete(*self.history_tree.get_children()[:excess])
+            self._history_rows = self._HISTORY_MAX_ENTRIES
+
+        if at_bottom:
+            self.history_tree.see(item)  # Auto-scroll to bottom
+
+    def _rebuild_history_list(self):
+        """Replace the history list contents with the entries in flight_history."""
+        self._history_pending.clear()
+        self.history_tree.delete(*self.history_tree.get_children())
+        self._history_rows = len(self.flight_history)
+        item = None
+        for entry in self.flight_history:
+            item = self.history_tree.insert('', 'end', values=entry)
+        if item is not None:
+            self.history_tree.see(item)
 
     def _clear_flight_history(self):
         """Clear the flight history display."""
         self.flight_history.clear()
+        self._history_pending.clear()
+        self._history_rows = 0
         self.last_recorded_phase = None
+        self._last_history_key = None
 
-        def clear_history():
-            self.history_text.config(state='normal')
-            self.history_text.delete('1.0', 'end')
-            self.history_text.config(state='disabled')
-
-        self.parent.after(0, clear_history)
+        # Called from the Clear button on the Tk thread, so update the list directly
+        if self.history_tree is not None:
+            self.history_tree.delete(*self.history_tree.get_children())
 
     def _layout_action_buttons(self):
         """Layout action buttons based on available width."""
@@ -4,8 +4,10 @@ Provides navigation monitoring, control parameter adjustment, and flight status
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import re
 import math
+import threading
 import sys
 import os
 from typing import Dict, Any
@@ -17,35 +19,112 @@ if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
 from widgets import SerialMonitorWidget, ParameterPanel
+from core.tab_manager import ApplicationType
+
+
+# Telemetry patterns, compiled once for the per-line parsing path. Except for
+# _ABS_POS_RE they are matched against the lowercased data, so no
+# re.IGNORECASE is needed. Decimal values share one number grammar: signed
+# where the quantity can be negative.
+_NUM = r'(\d*\.?\d+)'
+_SIGNED_NUM = r'([-+]?\d*\.?\d+)'
+_FIX_RE = re.compile(r'fix status:.*\[ok\]|gps.*fix.*?(true|false|ok|valid)')
+_SAT_RE = re.compile(r'satellites:\s*(\d+)|sat.*?(\d+)')
+# Relative position: "Pos: N=12.3 E=-4.5 U=6.7". Only tried when 'pos' is in
+# the data; the N/E/U fields are matched as one run from a word start, since
+# lazy gaps between them backtrack cubically on long unterminated chunks.
+_POS_RE = re.compile(rf'\bn[=:]?{_SIGNED_NUM}[,\s]*e[=:]?{_SIGNED_NUM}[,\s]*u[=:]?{_SIGNED_NUM}')
+# Absolute position, matched case-sensitively: "Position: 39.246645°, -77.196397°, Alt: 180.6m"
+_ABS_POS_RE = re.compile(r'Position:\s*([-+]?\d+\.\d+)°,\s*([-+]?\d+\.\d+)°,\s*Alt:\s*(\d+\.\d+)m')
+_RANGE_RE = re.compile(rf'range.*?{_NUM}')
+_BEARING_RE = re.compile(rf'bearing.*?{_NUM}')
+_NAV_MODE_RE = re.compile(r'nav.*mode.*?([a-z_]+)')
+_FLIGHT_MODE_RE = re.compile(r'flight.*mode.*?([a-z_]+)')
+_ROLL_CMD_RE = re.compile(rf'roll.*cmd.*?{_SIGNED_NUM}')
+_MOTOR_CMD_RE = re.compile(rf'motor.*cmd.*?{_NUM}')
+# [SERVO] responses
+_SERVO_CENTER_RE = re.compile(r'center.*?(\d+\.?\d*)')
+_SERVO_RANGE_RE = re.compile(r'range.*?(\d+\.?\d*)')
+
+# Status label formats, bound once for the display update path
+_SATS_FMT = "Sats: {}".format
+_POS_FMT = "Pos: N={:.1f} E={:.1f} U={:.1f}".format
+_RANGE_FMT = "Range: {:.1f}m".format
+_BEARING_FMT = "Bearing: {:.0f}deg".format
+_FLIGHT_MODE_FMT = "Mode: {}".format
+_NAV_MODE_FMT = "Nav: {}".format
+_ROLL_FMT = "Roll: {:.1f}deg".format
+_MOTOR_FMT = "Motor: {:.0f}%".format
+_SERVO_CONFIG_FMT = "Config: Center={}us Range={}us Dir={}".format
+
+# Plain decimal typed into a parameter entry, e.g. "100", "-2.5", ".05"
+_DECIMAL_ENTRY_RE = re.compile(r'\s*[-+]?(?:\d+\.?\d*|\.\d+)\s*$')
 
 
 class GpsAutopilotTab:
     """GPS Autopilot control and monitoring interface."""
-    
+
+    # Dirty flags: which status display groups have changed since the last update
+    _DIRTY_GPS = 0x01       # GPS fix and satellite count
+    _DIRTY_POSITION = 0x02
+    _DIRTY_RANGE = 0x04     # Range and bearing to datum
+    _DIRTY_MODES = 0x08     # Flight and navigation mode
+    _DIRTY_COMMANDS = 0x10  # Roll and motor commands
+    _DIRTY_ARM = 0x20
+    _DIRTY_SERVO = 0x40
+
+    # Fixed status texts
+    _GPS_FIX_OK = "GPS: Fix OK"
+    _GPS_NO_FIX = "GPS: No Fix"
+    _ARM_BUTTON_TEXT = {'ARMED': "DISARM", 'DISARMED': "ARM"}  # Control mode -> button text
+
+    # Numeric parameter entries:
+    # name -> (label, default, min, max, command, message shown when out of range)
+    _PARAM_SPECS = {
+        'orbit_radius': ("Orbit Radius (m):", "100", 20, 500, "NAV SET RADIUS",
+                         "Orbit radius must be 20-500 meters"),
+        'airspeed': ("Airspeed (m/s):", "12.0", 5.0, 25.0, "NAV SET AIRSPEED",
+                     "Airspeed must be 5.0-25.0 m/s"),
+        'orbit_kp': ("Orbit Kp:", "0.05", 0.001, 1.0, "CTRL SET ORBIT_KP", "Orbit Kp must be 0.001-1.0"),
+        'track_kp': ("Track Kp:", "1.0", 0.1, 10.0, "CTRL SET TRACK_KP", "Track Kp must be 0.1-10.0"),
+        'track_ki': ("Track Ki:", "0.2", 0.0, 2.0, "CTRL SET TRACK_KI", "Track Ki must be 0.0-2.0"),
+        'roll_kp': ("Roll Kp:", "1.5", 0.1, 5.0, "CTRL SET ROLL_KP", "Roll Kp must be 0.1-5.0"),
+        'servo_center': ("Center (us):", "1500", 1400, 1600, "SERVO SET CENTER",
+                         "Center must be 1400-1600 us"),
+        'servo_range': ("Range (us):", "400", 200, 600, "SERVO SET RANGE", "Range must be 200-600 us"),
+    }
+
+    # Routine datum commands are confirmed by a second press within this window
+    # instead of a modal dialog
+    _CONFIRM_WINDOW_MS = 2000
+
     def __init__(self, parent, serial_monitor, tab_manager):
         self.parent = parent
         self.serial_monitor = serial_monitor
         self.tab_manager = tab_manager
 
-        # Rate limiting for updates
-        self.last_update_time = 0
-        self.update_interval = 0.1  # Limit updates to 10Hz
+        # Rate limiting for updates: parsed changes are shown by one timed update
+        self.update_interval_ms = 100  # Limit updates to 10Hz
+        self._dirty = 0
+        self._update_pending = False
+        # Guards _dirty and _update_pending, which the reader thread sets while
+        # parsing and the Tk thread takes and clears in _update_status_displays
+        self._dirty_lock = threading.Lock()
+        self._update_after_id = None
+        self._alive = True  # Cleared when the tab frame is destroyed
+        self._last_display = {}  # Status label key -> text last shown
 
         # Navigation state
         self.nav_data = {
-            'datum_lat': 0.0, 'datum_lon': 0.0, 'datum_alt': 0.0,
-            'current_lat': 0.0, 'current_lon': 0.0, 'current_alt': 0.0,
             'position_n': 0.0, 'position_e': 0.0, 'position_u': 0.0,
             'range_to_datum': 0.0, 'bearing_to_datum': 0.0,
-            'ground_speed': 0.0, 'ground_track': 0.0,
             'nav_mode': 'UNKNOWN', 'gps_fix': False, 'satellites': 0
         }
 
         # Control state
         self.control_data = {
             'flight_mode': 'IDLE', 'control_mode': 'MANUAL',
-            'roll_command': 0.0, 'track_command': 0.0,
-            'motor_command': 0.0, 'orbit_error': 0.0
+            'roll_command': 0.0, 'motor_command': 0.0
         }
 
         # Servo configuration state
@@ -54,6 +133,20 @@ class GpsAutopilotTab:
             'updated': False
         }
 
+        # Single-value telemetry fields: (keyword, pattern, store, key, convert, dirty flag).
+        # A pattern is only tried when its keyword appears in the lowercased data.
+        self._field_parsers = (
+            ('range', _RANGE_RE, self.nav_data, 'range_to_datum', float, self._DIRTY_RANGE),
+            ('bearing', _BEARING_RE, self.nav_data, 'bearing_to_datum', float, self._DIRTY_RANGE),
+            ('nav', _NAV_MODE_RE, self.nav_data, 'nav_mode', str.upper, self._DIRTY_MODES),
+            ('flight', _FLIGHT_MODE_RE, self.control_data, 'flight_mode', str.upper, self._DIRTY_MODES),
+            ('roll', _ROLL_CMD_RE, self.control_data, 'roll_command', float, self._DIRTY_COMMANDS),
+            ('motor', _MOTOR_CMD_RE, self.control_data, 'motor_command', float, self._DIRTY_COMMANDS),
+        )
+
+        # Buttons awaiting a confirming second press: key -> reset after() id
+        self._pending_confirm = {}
+
         # Responsive layout state
         self.is_mobile_layout = False
         self.main_paned = None
@@ -66,10 +159,10 @@ class GpsAutopilotTab:
 
         # Create main tab frame
         self.frame = ttk.Frame(parent)
+        self._mono_font = tkfont.Font(family='Consolas', size=9)  # Shared by the readout labels
         self._create_widgets()
         
         # Register with tab manager
-        from core.tab_manager import ApplicationType
         tab_manager.register_tab(ApplicationType.GPS_AUTOPILOT, self.handle_serial_data)
         
     def _create_widgets(self):
@@ -83,6 +176,11 @@ class GpsAutopilotTab:
         self.left_frame = ttk.Frame(self.frame)
         self.right_frame = ttk.Frame(self.frame)
 
+        # Parameter values exist up front: serial parsing updates the servo
+        # ones, and most parameter tabs are only built when first selected
+        self.param_vars = {name: tk.StringVar(value=spec[1])
+                           for name, spec in self._PARAM_SPECS.items()}
+
         # Create control sections (once, never destroyed)
         self._create_navigation_controls(self.left_frame)
         self._create_control_parameters(self.left_frame)
@@ -102,6 +200,7 @@ class GpsAutopilotTab:
 
         # Bind resize events to main frame
         self.frame.bind('<Configure>', self._on_main_frame_resize)
+        self.frame.bind('<Destroy>', self._on_destroy)
 
     def _update_grid_layout(self):
         """Update grid layout based on mobile/desktop mode and available space."""
@@ -138,23 +237,9 @@ class GpsAutopilotTab:
         nav_frame = ttk.LabelFrame(parent, text="Navigation Parameters")
         nav_frame.pack(fill='x', padx=5, pady=5)
         
-        # Orbit radius
-        radius_frame = ttk.Frame(nav_frame)
-        radius_frame.pack(fill='x', padx=5, pady=2)
-        ttk.Label(radius_frame, text="Orbit Radius (m):").pack(side='left')
-        self.orbit_radius_var = tk.StringVar(value="100")
-        radius_entry = ttk.Entry(radius_frame, textvariable=self.orbit_radius_var, width=8)
-        radius_entry.pack(side='left', padx=5)
-        ttk.Button(radius_frame, text="Set", command=self._set_orbit_radius).pack(side='left', padx=2)
-        
-        # Nominal airspeed
-        airspeed_frame = ttk.Frame(nav_frame)
-        airspeed_frame.pack(fill='x', padx=5, pady=2)
-        ttk.Label(airspeed_frame, text="Airspeed (m/s):").pack(side='left')
-        self.airspeed_var = tk.StringVar(value="12.0")
-        airspeed_entry = ttk.Entry(airspeed_frame, textvariable=self.airspeed_var, width=8)
-        airspeed_entry.pack(side='left', padx=5)
-        ttk.Button(airspeed_frame, text="Set", command=self._set_airspeed).pack(side='left', padx=2)
+        # Orbit radius and nominal airspeed
+        self._make_param_row(nav_frame, 'orbit_radius')
+        self._make_param_row(nav_frame, 'airspeed')
         
         # GPS settings
         gps_frame = ttk.Frame(nav_frame)
@@ -169,106 +254,97 @@ class GpsAutopilotTab:
         # Datum controls
         datum_frame = ttk.Frame(nav_frame)
         datum_frame.pack(fill='x', padx=5, pady=5)
-        ttk.Button(datum_frame, text="Set Datum", command=self._set_datum).pack(side='left', padx=2)
-        ttk.Button(datum_frame, text="Clear Datum", command=self._clear_datum).pack(side='left', padx=2)
+        self.set_datum_btn = ttk.Button(datum_frame, text="Set Datum", command=self._set_datum)
+        self.set_datum_btn.pack(side='left', padx=2)
+        self.clear_datum_btn = ttk.Button(datum_frame, text="Clear Datum", command=self._clear_datum)
+        self.clear_datum_btn.pack(side='left', padx=2)
         
     def _create_control_parameters(self, parent):
         """Create control parameter adjustment."""
         control_frame = ttk.LabelFrame(parent, text="Control Parameters")
         control_frame.pack(fill='x', padx=5, pady=5)
         
+        # Servo values parsed from [SERVO] responses; each tab's widgets are
+        # built the first time it is selected
+        self.servo_direction_var = tk.StringVar(value="Normal")
+        self.servo_config_var = tk.StringVar(value=_SERVO_CONFIG_FMT(1500, 400, "Normal"))
+
         # Create notebook for parameter groups
         param_notebook = ttk.Notebook(control_frame)
         param_notebook.pack(fill='both', expand=True, padx=5, pady=5)
-        
-        # Orbit control tab
+
+        # Orbit tab is shown first, so it is built now
         orbit_tab = ttk.Frame(param_notebook)
         param_notebook.add(orbit_tab, text="Orbit")
+        self._build_orbit_tab(orbit_tab)
+
+        self._param_tab_builders = {}  # Unbuilt tab path -> (builder, tab frame)
+        for text, builder in (("Track", self._build_track_tab), ("Roll", self._build_roll_tab),
+                              ("Servo", self._build_servo_tab)):
+            tab = ttk.Frame(param_notebook)
+            param_notebook.add(tab, text=text)
+            self._param_tab_builders[str(tab)] = (builder, tab)
+        param_notebook.bind('<<NotebookTabChanged>>', self._on_param_tab_changed)
         
-        # Orbit proportional gain
-        orbit_kp_frame = ttk.Frame(orbit_tab)
-        orbit_kp_frame.pack(fill='x', padx=5, pady=2)
-        ttk.Label(orbit_kp_frame, text="Orbit Kp:").pack(side='left')
-        self.orbit_kp_var = tk.StringVar(value="0.05")
-        orbit_kp_entry = ttk.Entry(orbit_kp_frame, textvariable=self.orbit_kp_var, width=8)
-        orbit_kp_entry.pack(side='left', padx=5)
-        ttk.Button(orbit_kp_frame, text="Set", command=self._set_orbit_kp).pack(side='left', padx=2)
-        
-        # Track control tab
-        track_tab = ttk.Frame(param_notebook)
-        param_notebook.add(track_tab, text="Track")
-        
-        # Track proportional gain
-        track_kp_frame = ttk.Frame(track_tab)
-        track_kp_frame.pack(fill='x', padx=5, pady=2)
-        ttk.Label(track_kp_frame, text="Track Kp:").pack(side='left')
-        self.track_kp_var = tk.StringVar(value="1.0")
-        track_kp_entry = ttk.Entry(track_kp_frame, textvariable=self.track_kp_var, width=8)
-        track_kp_entry.pack(side='left', padx=5)
-        ttk.Button(track_kp_frame, text="Set", command=self._set_track_kp).pack(side='left', padx=2)
-        
-        # Track integral gain
-        track_ki_frame = ttk.Frame(track_tab)
-        track_ki_frame.pack(fill='x', padx=5, pady=2)
-        ttk.Label(track_ki_frame, text="Track Ki:").pack(side='left')
-        self.track_ki_var = tk.StringVar(value="0.2")
-        track_ki_entry = ttk.Entry(track_ki_frame, textvariable=self.track_ki_var, width=8)
-        track_ki_entry.pack(side='left', padx=5)
-        ttk.Button(track_ki_frame, text="Set", command=self._set_track_ki).pack(side='left', padx=2)
+        # Control action buttons
+        action_frame = ttk.Frame(control_frame)
+        action_frame.pack(fill='x', padx=5, pady=5)
         
-        # Roll control tab
-        roll_tab = ttk.Frame(param_notebook)
-        param_notebook.add(roll_tab, text="Roll")
-
-        # Roll proportional gain
-        roll_kp_frame = ttk.Frame(roll_tab)
-        roll_kp_frame.pack(fill='x', padx=5, pady=2)
-        ttk.Label(roll_kp_frame, text="Roll Kp:").pack(side='left')
-        self.roll_kp_var = tk.StringVar(value="1.5")
-        roll_kp_entry = ttk.Entry(roll_kp_frame, textvariable=self.roll_kp_var, width=8)
-        roll_kp_entry.pack(side='left', padx=5)
-        ttk.Button(roll_kp_frame, text="Set", command=self._set_roll_kp).pack(side='left', padx=2)
-
-        # Servo configuration tab
-        servo_tab = ttk.Frame(param_notebook)
-        param_notebook.add(servo_tab, text="Servo")
+        ttk.Button(action_frame, text="Get All Params", 
+                  command=self._get_all_parameters).pack(side='left', padx=2)
+        ttk.Button(action_frame, text="Reset Defaults", 
+                  command=self._reset_parameters).pack(side='left', padx=2)
 
+    def _on_param_tab_changed(self, event):
+        """Build a parameter tab's widgets the first time it is shown."""
+        entry = self._param_tab_builders.pop(str(event.widget.select()), None)
+        if entry:
+            builder, tab = entry
+            builder(tab)
+
+    def _make_param_row(self, parent, name):
+        """Create a label, entry and Set button row for a numeric parameter."""
+        row = ttk.Frame(parent)
+        row.pack(fill='x', padx=5, pady=2)
+        ttk.Label(row, text=self._PARAM_SPECS[name][0]).pack(side='left')
+        ttk.Entry(row, textvariable=self.param_vars[name], width=8).pack(side='left', padx=5)
+        ttk.Button(row, text="Set", command=lambda n=name: self._set_param(n)).pack(side='left', padx=2)
+
+    def _build_orbit_tab(self, orbit_tab):
+        """Build the Orbit parameter tab."""
+        self._make_param_row(orbit_tab, 'orbit_kp')
+
+    def _build_track_tab(self, track_tab):
+        """Build the Track parameter tab."""
+        self._make_param_row(track_tab, 'track_kp')
+        self._make_param_row(track_tab, 'track_ki')
+
+    def _build_roll_tab(self, roll_tab):
+        """Build the Roll parameter tab."""
+        self._make_param_row(roll_tab, 'roll_kp')
+
+    def _build_servo_tab(self, servo_tab):
+        """Build the Servo configuration tab."""
         # Roll servo direction
         direction_frame = ttk.Frame(servo_tab)
         direction_frame.pack(fill='x', padx=5, pady=2)
         ttk.Label(direction_frame, text="Direction:").pack(side='left')
-        self.servo_direction_var = tk.StringVar(value="Normal")
         direction_combo = ttk.Combobox(direction_frame, textvariable=self.servo_direction_var,
                                       values=["Normal", "Inverted"], width=10, state='readonly')
         direction_combo.pack(side='left', padx=5)
         ttk.Button(direction_frame, text="Set", command=self._set_servo_direction).pack(side='left', padx=2)
 
-        # Roll servo center
-        center_frame = ttk.Frame(servo_tab)
-        center_frame.pack(fill='x', padx=5, pady=2)
-        ttk.Label(center_frame, text="Center (us):").pack(side='left')
-        self.servo_center_var = tk.StringVar(value="1500")
-        center_entry = ttk.Entry(center_frame, textvariable=self.servo_center_var, width=8)
-        center_entry.pack(side='left', padx=5)
-        ttk.Button(center_frame, text="Set", command=self._set_servo_center).pack(side='left', padx=2)
-
-        # Roll servo range
-        range_frame = ttk.Frame(servo_tab)
-        range_frame.pack(fill='x', padx=5, pady=2)
-        ttk.Label(range_frame, text="Range (us):").pack(side='left')
-        self.servo_range_var = tk.StringVar(value="400")
-        range_entry = ttk.Entry(range_frame, textvariable=self.servo_range_var, width=8)
-        range_entry.pack(side='left', padx=5)
-        ttk.Button(range_frame, text="Set", command=self._set_servo_range).pack(side='left', padx=2)
+        # Roll servo center and range
+        self._make_param_row(servo_tab, 'servo_center')
+        self._make_param_row(servo_tab, 'servo_range')
 
         # Servo status display
         servo_status_frame = ttk.LabelFrame(servo_tab, text="Servo Status")
         servo_status_frame.pack(fill='x', padx=5, pady=5)
 
         # Current configuration display
-        self.servo_config_var = tk.StringVar(value="Config: Center=1500us Range=400us Dir=Normal")
         ttk.Label(servo_status_frame, textvariable=self.servo_config_var,
-                 font=('Consolas', 9)).pack(padx=5, pady=2)
+                 font=self._mono_font).pack(padx=5, pady=2)
 
         # Servo action buttons
         servo_action_frame = ttk.Frame(servo_tab)
@@ -278,15 +354,6 @@ class GpsAutopilotTab:
         ttk.Button(servo_action_frame, text="Test Servo",
                   command=self._test_servo).pack(side='left', padx=2)
         
-        # Control action buttons
-        action_frame = ttk.Frame(control_frame)
-        action_frame.pack(fill='x', padx=5, pady=5)
-        
-        ttk.Button(action_frame, text="Get All Params", 
-                  command=self._get_all_parameters).pack(side='left', padx=2)
-        ttk.Button(action_frame, text="Reset Defaults", 
-                  command=self._reset_parameters).pack(side='left', padx=2)
-        
     def _create_flight_status(self, parent):
         """Create flight status display."""
         status_frame = ttk.LabelFrame(parent, text="Flight Status")
@@ -308,7 +375,7 @@ class GpsAutopilotTab:
         pos_frame = ttk.Frame(nav_status_frame)
         pos_frame.pack(fill='x', padx=5, pady=2)
         self.position_var = tk.StringVar(value="Pos: N=0.0 E=0.0 U=0.0")
-        ttk.Label(pos_frame, textvariable=self.position_var, font=('Consolas', 9)).pack()
+        ttk.Label(pos_frame, textvariable=self.position_var, font=self._mono_font).pack()
         
         # Range and bearing
         range_frame = ttk.Frame(nav_status_frame)
@@ -356,84 +423,52 @@ class GpsAutopilotTab:
         else:
             messagebox.showwarning("Not Connected", "Please connect to Arduino first")
             
-    # Navigation parameter setters
-    def _set_orbit_radius(self):
-        """Set orbit radius parameter."""
-        try:
-            radius = float(self.orbit_radius_var.get())
-            if not (20 <= radius <= 500):
-                raise ValueError("Orbit radius must be 20-500 meters")
-            self._send_command(f"NAV SET RADIUS {radius}")
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
-            
-    def _set_airspeed(self):
-        """Set nominal airspeed parameter."""
-        try:
-            airspeed = float(self.airspeed_var.get())
-            if not (5.0 <= airspeed <= 25.0):
-                raise ValueError("Airspeed must be 5.0-25.0 m/s")
-            self._send_command(f"NAV SET AIRSPEED {airspeed}")
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
-            
+    def _set_param(self, name):
+        """Range-check a numeric parameter entry and send it to the autopilot."""
+        _, _, low, high, command, message = self._PARAM_SPECS[name]
+        text = self.param_vars[name].get()
+        value = float(text) if _DECIMAL_ENTRY_RE.match(text) else None
+        if value is None or not (low <= value <= high):
+            messagebox.showerror("Invalid Value", message)
+            return
+        self._send_command(f"{command} {value}")
+
+    # Navigation settings
     def _set_gps_rate(self):
         """Set GPS update rate."""
         rate = self.gps_rate_var.get()
         self._send_command(f"NAV SET GPS_RATE {rate}")
         
     def _set_datum(self):
-        """Set current position as datum."""
-        if messagebox.askyesno("Set Datum", 
-                              "Set current GPS position as orbit center?"):
+        """Set current position as datum (press twice to confirm)."""
+        if self._confirm_press('set_datum', self.set_datum_btn, "Set Datum"):
             self._send_command("NAV SET_DATUM")
             
     def _clear_datum(self):
-        """Clear current datum."""
-        if messagebox.askyesno("Clear Datum", "Clear current datum point?"):
+        """Clear current datum (press twice to confirm)."""
+        if self._confirm_press('clear_datum', self.clear_datum_btn, "Clear Datum"):
             self._send_command("NAV CLEAR_DATUM")
-            
-    # Control parameter setters
-    def _set_orbit_kp(self):
-        """Set orbit controller proportional gain."""
-        try:
-            kp = float(self.orbit_kp_var.get())
-            if not (0.001 <= kp <= 1.0):
-                raise ValueError("Orbit Kp must be 0.001-1.0")
-            self._send_command(f"CTRL SET ORBIT_KP {kp}")
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
-            
-    def _set_track_kp(self):
-        """Set track controller proportional gain."""
-        try:
-            kp = float(self.track_kp_var.get())
-            if not (0.1 <= kp <= 10.0):
-                raise ValueError("Track Kp must be 0.1-10.0")
-            self._send_command(f"CTRL SET TRACK_KP {kp}")
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
-            
-    def _set_track_ki(self):
-        """Set track controller integral gain."""
-        try:
-            ki = float(self.track_ki_var.get())
-            if not (0.0 <= ki <= 2.0):
-                raise ValueError("Track Ki must be 0.0-2.0")
-            self._send_command(f"CTRL SET TRACK_KI {ki}")
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
-            
-    def _set_roll_kp(self):
-        """Set roll controller proportional gain."""
-        try:
-            kp = float(self.roll_kp_var.get())
-            if not (0.1 <= kp <= 5.0):
-                raise ValueError("Roll Kp must be 0.1-5.0")
-            self._send_command(f"CTRL SET ROLL_KP {kp}")
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
 
+    def _confirm_press(self, key, button, text):
+        """Return True on a second press within the confirm window.
+
+        The first press relabels the button "Confirm?" and returns False; the
+        label reverts if no second press arrives in time.
+        """
+        after_id = self._pending_confirm.pop(key, None)
+        if after_id is not None:
+            self.parent.after_cancel(after_id)
+            button.config(text=text)
+            return True
+
+        def expire():
+            self._pending_confirm.pop(key, None)
+            button.config(text=text)
+
+        button.config(text="Confirm?")
+        self._pending_confirm[key] = self.parent.after(self._CONFIRM_WINDOW_MS, expire)
+        return False
+            
     # Servo configuration functions
     def _set_servo_direction(self):
         """Set roll servo direction."""
@@ -441,26 +476,6 @@ class GpsAutopilotTab:
         reversed_val = "1" if direction == "Inverted" else "0"
         self._send_command(f"SERVO SET DIRECTION {reversed_val}")
 
-    def _set_servo_center(self):
-        """Set roll servo center position."""
-        try:
-            center = float(self.servo_center_var.get())
-            if not (1400 <= center <= 1600):
-                raise ValueError("Center must be 1400-1600 us")
-            self._send_command(f"SERVO SET CENTER {center}")
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
-
-    def _set_servo_range(self):
-        """Set roll servo range."""
-        try:
-            range_val = float(self.servo_range_var.get())
-            if not (200 <= range_val <= 600):
-                raise ValueError("Range must be 200-600 us")
-            self._send_command(f"SERVO SET RANGE {range_val}")
-        except ValueError as e:
-            messagebox.showerror("Invalid Value", str(e))
-
     def _get_servo_config(self):
         """Get current servo configuration."""
         self._send_command("SERVO GET")
@@ -496,63 +511,73 @@ class GpsAutopilotTab:
                 self.arm_btn.config(text="ARM")
             
     def handle_serial_data(self, data):
-        """Handle incoming serial data for GpsAutopilot."""
+        """Handle incoming serial data for GpsAutopilot.
+
+        Called on the serial reader thread, so parsing stays off the Tk thread;
+        only _update_status_displays runs on it, scheduled through after().
+        """
         try:
             # Display in serial monitor
             self.serial_monitor_widget.log_received(data)
+            data_lower = data.lower()
 
-            # Parse navigation data
-            self._parse_navigation_data(data)
+            with self._dirty_lock:
+                # Parse navigation data
+                self._parse_navigation_data(data, data_lower)
 
-            # Parse control data
-            self._parse_control_data(data)
+                # Parse control data
+                self._parse_control_data(data_lower)
 
-            # Parse servo data
-            self._parse_servo_data(data)
+                # Parse single-value navigation and control fields
+                self._parse_fields(data_lower)
 
-            # Update displays with rate limiting
-            import time
-            current_time = time.time()
-            if current_time - self.last_update_time >= self.update_interval:
-                self._update_status_displays()
-                self.last_update_time = current_time
-        except Exception as e:
+                # Parse servo data
+                self._parse_servo_data(data, data_lower)
+
+                # Show changes with rate limiting; one pending update covers a burst
+                schedule = bool(self._dirty) and not self._update_pending and self._alive
+                if schedule:
+                    self._update_pending = True
+
+            # after() from this thread waits on the Tk thread, so call it
+            # without holding the lock _update_status_displays takes
+            if schedule:
+                self._update_after_id = self.parent.after(self.update_interval_ms,
+                                                          self._update_status_displays)
+        except (ValueError, AttributeError, re.error) as e:
+            # The raw data was already logged to the serial monitor above
             print(f"Error handling GPS autopilot data: {e}")
-            # Still display the raw data in serial monitor even if parsing fails
-            try:
-                self.serial_monitor_widget.log_received(data)
-            except:
-                pass
         
-    def _parse_navigation_data(self, data):
+    def _parse_navigation_data(self, data, data_lower):
         """Parse navigation information from serial data."""
+        # Each pattern needs its keyword in the line; skip the regex when it is absent
         try:
             # GPS fix status - check multiple formats
-            gps_fix_match = re.search(r'Fix Status:.*\[OK\]|GPS.*fix.*?(true|false|ok|valid)', data, re.IGNORECASE)
+            gps_fix_match = _FIX_RE.search(data_lower) if 'fix' in data_lower else None
             if gps_fix_match:
                 if '[OK]' in data:
-                    self.nav_data['gps_fix'] = True
+                    gps_fix = True
                 elif gps_fix_match.group(1):
-                    self.nav_data['gps_fix'] = gps_fix_match.group(1).lower() in ['true', 'ok', 'valid']
+                    gps_fix = gps_fix_match.group(1).lower() in ['true', 'ok', 'valid']
                 else:
-                    self.nav_data['gps_fix'] = False
+                    gps_fix = False
+                self._set_field(self.nav_data, 'gps_fix', gps_fix, self._DIRTY_GPS)
 
             # Satellite count
-            sat_match = re.search(r'Satellites:\s*(\d+)|sat.*?(\d+)', data, re.IGNORECASE)
+            sat_match = _SAT_RE.search(data_lower) if 'sat' in data_lower else None
             if sat_match:
                 # Use first group if it matches, otherwise second group
                 sat_count = sat_match.group(1) if sat_match.group(1) else sat_match.group(2)
-                self.nav_data['satellites'] = int(sat_count)
+                self._set_field(self.nav_data, 'satellites', int(sat_count), self._DIRTY_GPS)
 
             # Position data - handle both relative (N/E/U) and absolute (lat/lon) formats
-            pos_match = re.search(r'pos.*?n[=:]?([-+]?\d*\.?\d+).*?e[=:]?([-+]?\d*\.?\d+).*?u[=:]?([-+]?\d*\.?\d+)', data, re.IGNORECASE)
+            pos_match = _POS_RE.search(data_lower) if 'pos' in data_lower else None
             if pos_match:
-                self.nav_data['position_n'] = float(pos_match.group(1))
-                self.nav_data['position_e'] = float(pos_match.group(2))
-                self.nav_data['position_u'] = float(pos_match.group(3))
-            else:
+                self._set_position(float(pos_match.group(1)), float(pos_match.group(2)),
+                                   float(pos_match.group(3)))
+            elif 'Position:' in data:
                 # Try absolute coordinate format: Position: 39.246645°, -77.196397°, Alt: 180.6m
-                abs_pos_match = re.search(r'Position:\s*([-+]?\d+\.\d+)°,\s*([-+]?\d+\.\d+)°,\s*Alt:\s*(\d+\.\d+)m', data)
+                abs_pos_match = _ABS_POS_RE.search(data)
                 if abs_pos_match:
                     # Store absolute coordinates in position fields for display
                     lat = float(abs_pos_match.group(1))
@@ -560,135 +585,154 @@ class GpsAutopilotTab:
                     alt = float(abs_pos_match.group(3))
 
                     # Convert to display format (use lat/lon as N/E for now)
-                    self.nav_data['position_n'] = lat
-                    self.nav_data['position_e'] = lon
-                    self.nav_data['position_u'] = alt
-
-            # Range and bearing
-            range_match = re.search(r'range.*?(\d*\.?\d+)', data, re.IGNORECASE)
-            if range_match:
-                self.nav_data['range_to_datum'] = float(range_match.group(1))
-
-            bearing_match = re.search(r'bearing.*?(\d*\.?\d+)', data, re.IGNORECASE)
-            if bearing_match:
-                self.nav_data['bearing_to_datum'] = float(bearing_match.group(1))
+                    self._set_position(lat, lon, alt)
 
-            # Navigation mode
-            nav_mode_match = re.search(r'nav.*mode.*?([A-Z_]+)', data, re.IGNORECASE)
-            if nav_mode_match:
-                self.nav_data['nav_mode'] = nav_mode_match.group(1).upper()
         except Exception as e:
             print(f"Error parsing navigation data: {e}")
             
-    def _parse_control_data(self, data):
-        """Parse control information from serial data."""
-        # Flight mode
-        flight_mode_match = re.search(r'flight.*mode.*?([A-Z_]+)', data, re.IGNORECASE)
-        if flight_mode_match:
-            self.control_data['flight_mode'] = flight_mode_match.group(1).upper()
-            
-        # Roll command
-        roll_match = re.search(r'roll.*cmd.*?([-+]?\d*\.?\d+)', data, re.IGNORECASE)
-        if roll_match:
-            self.control_data['roll_command'] = float(roll_match.group(1))
-
-        # Motor command
-        motor_match = re.search(r'motor.*cmd.*?(\d*\.?\d+)', data, re.IGNORECASE)
-        if motor_match:
-            self.control_data['motor_command'] = float(motor_match.group(1))
-            
-        # Control mode (ARM/DISARM status) - store data only, update GUI later
-        if re.search(r'armed', data, re.IGNORECASE):
-            self.control_data['control_mode'] = 'ARMED'
-        elif re.search(r'disarmed', data, re.IGNORECASE):
-            self.control_data['control_mode'] = 'DISARMED'
-
-    def _parse_servo_data(self, data):
+    def _parse_control_data(self, data_lower):
+        """Parse control information from lowercased serial data."""
+        # Control mode (ARM/DISARM status) - store data only, update GUI later.
+        # 'armed' is part of 'disarmed', so the longer word is checked first.
+        if 'disarmed' in data_lower:
+            self._set_field(self.control_data, 'control_mode', 'DISARMED', self._DIRTY_ARM)
+        elif 'armed' in data_lower:
+            self._set_field(self.control_data, 'control_mode', 'ARMED', self._DIRTY_ARM)
+
+    def _parse_fields(self, data_lower):
+        """Parse range, bearing, modes and commands using the field table."""
+        for keyword, pattern, store, key, convert, flag in self._field_parsers:
+            if keyword in data_lower:
+                match = pattern.search(data_lower)
+                if match:
+                    self._set_field(store, key, convert(match.group(1)), flag)
+
+    def _set_field(self, store, key, value, flag):
+        """Store a parsed value, marking its display group dirty if it changed."""
+        if store[key] != value:
+            store[key] = value
+            self._dirty |= flag
+
+    def _set_position(self, n, e, u):
+        """Store a parsed position, marking the position display dirty if it changed."""
+        nav = self.nav_data
+        if (nav['position_n'], nav['position_e'], nav['position_u']) != (n, e, u):
+            nav['position_n'] = n
+            nav['position_e'] = e
+            nav['position_u'] = u
+            self._dirty |= self._DIRTY_POSITION
+
+    def _parse_servo_data(self, data, data_lower):
         """Parse servo configuration information from serial data."""
         # Servo configuration responses - store data only, update GUI later
         if '[SERVO]' in data:
             # Center position
-            center_match = re.search(r'center.*?(\d+\.?\d*)', data, re.IGNORECASE)
+            center_match = _SERVO_CENTER_RE.search(data_lower)
             if center_match:
                 center = float(center_match.group(1))
                 self.servo_config_data['center'] = int(center)
 
             # Range
-            range_match = re.search(r'range.*?(\d+\.?\d*)', data, re.IGNORECASE)
+            range_match = _SERVO_RANGE_RE.search(data_lower)
             if range_match:
                 range_val = float(range_match.group(1))
                 self.servo_config_data['range'] = int(range_val)
 
             # Direction
-            if 'inverted' in data.lower():
+            if 'inverted' in data_lower:
                 self.servo_config_data['direction'] = "Inverted"
-            elif 'normal' in data.lower():
+            elif 'normal' in data_lower:
                 self.servo_config_data['direction'] = "Normal"
 
             # Set flag for GUI update
             self.servo_config_data['updated'] = True
+            self._dirty |= self._DIRTY_SERVO
             
     def _update_status_displays(self):
-        """Update all status displays."""
-        def update_displays():
-            # Update ARM/DISARM button based on control mode
-            if self.control_data.get('control_mode') == 'ARMED':
-                self.arm_btn.config(text="DISARM")
-            elif self.control_data.get('control_mode') == 'DISARMED':
-                self.arm_btn.config(text="ARM")
+        """Update the status displays whose data changed since the last update."""
+        # Take the dirty flags and clear the pending flag together: a change
+        # parsed on the reader thread after this point schedules the next update
+        with self._dirty_lock:
+            self._update_pending = False
+            self._update_after_id = None
+            dirty, self._dirty = self._dirty, 0
+        if not self._alive:
+            return
 
-            # GPS status
-            if self.nav_data['gps_fix']:
-                self.gps_status_var.set("GPS: Fix OK")
-            else:
-                self.gps_status_var.set("GPS: No Fix")
-                
-            self.satellites_var.set(f"Sats: {self.nav_data['satellites']}")
-            
-            # Position
-            n = self.nav_data['position_n']
-            e = self.nav_data['position_e']
-            u = self.nav_data['position_u']
-            self.position_var.set(f"Pos: N={n:.1f} E={e:.1f} U={u:.1f}")
-            
-            # Range and bearing
-            self.range_var.set(f"Range: {self.nav_data['range_to_datum']:.1f}m")
-            self.bearing_var.set(f"Bearing: {self.nav_data['bearing_to_datum']:.0f}deg")
-            
-            # Modes
-            self.flight_mode_var.set(f"Mode: {self.control_data['flight_mode']}")
-            self.nav_mode_var.set(f"Nav: {self.nav_data['nav_mode']}")
-            
-            # Control outputs
-            self.roll_cmd_var.set(f"Roll: {self.control_data['roll_command']:.1f}deg")
-            self.motor_cmd_var.set(f"Motor: {self.control_data['motor_command']:.0f}%")
+        # Update ARM/DISARM button based on control mode
+        if dirty & self._DIRTY_ARM:
+            arm_text = self._ARM_BUTTON_TEXT.get(self.control_data.get('control_mode'))
+            if arm_text and self.arm_btn['text'] != arm_text:
+                self.arm_btn.config(text=arm_text)
 
-            # Update servo configuration if changed
-            if self.servo_config_data['updated']:
-                self.servo_center_var.set(str(self.servo_config_data['center']))
-                self.servo_range_var.set(str(self.servo_config_data['range']))
-                self.servo_direction_var.set(self.servo_config_data['direction'])
+        # GPS status
+        if dirty & self._DIRTY_GPS:
+            self._show('gps', self.gps_status_var,
+                       self._GPS_FIX_OK if self.nav_data['gps_fix'] else self._GPS_NO_FIX)
 
-                # Update servo display
-                center = self.servo_config_data['center']
-                range_val = self.servo_config_data['range']
-                direction = self.servo_config_data['direction']
-                config_text = f"Config: Center={center}us Range={range_val}us Dir={direction}"
-                self.servo_config_var.set(config_text)
+            self._show('sats', self.satellites_var, _SATS_FMT(self.nav_data['satellites']))
 
-                # Reset update flag
-                self.servo_config_data['updated'] = False
+        # Position
+        if dirty & self._DIRTY_POSITION:
+            nav = self.nav_data
+            self._show('position', self.position_var,
+                       _POS_FMT(nav['position_n'], nav['position_e'], nav['position_u']))
 
-        self.parent.after(0, update_displays)
+        # Range and bearing
+        if dirty & self._DIRTY_RANGE:
+            self._show('range', self.range_var, _RANGE_FMT(self.nav_data['range_to_datum']))
+            self._show('bearing', self.bearing_var, _BEARING_FMT(self.nav_data['bearing_to_datum']))
+
+        # Modes
+        if dirty & self._DIRTY_MODES:
+            self._show('flight_mode', self.flight_mode_var, _FLIGHT_MODE_FMT(self.control_data['flight_mode']))
+            self._show('nav_mode', self.nav_mode_var, _NAV_MODE_FMT(self.nav_data['nav_mode']))
+
+        # Control outputs
+        if dirty & self._DIRTY_COMMANDS:
+            self._show('roll', self.roll_cmd_var, _ROLL_FMT(self.control_data['roll_command']))
+            self._show('motor', self.motor_cmd_var, _MOTOR_FMT(self.control_data['motor_command']))
+
+        # Update servo configuration if changed
+        if dirty & self._DIRTY_SERVO and self.servo_config_data['updated']:
+            self.param_vars['servo_center'].set(str(self.servo_config_data['center']))
+            self.param_vars['servo_range'].set(str(self.servo_config_data['range']))
+            self.servo_direction_var.set(self.servo_config_data['direction'])
+
+            # Update servo display
+            servo = self.servo_config_data
+            self.servo_config_var.set(_SERVO_CONFIG_FMT(servo['center'], servo['range'],
+                                                        servo['direction']))
+
+            # Reset update flag
+            self.servo_config_data['updated'] = False
+
+    def _show(self, key, var, text):
+        """Set a status label variable unless it already shows this text."""
+        if self._last_display.get(key) != text:
+            self._last_display[key] = text
+            var.set(text)
 
     def _update_servo_config_display(self):
         """Update servo configuration display (called by user input)."""
-        center = self.servo_center_var.get()
-        range_val = self.servo_range_var.get()
+        center = self.param_vars['servo_center'].get()
+        range_val = self.param_vars['servo_range'].get()
         direction = self.servo_direction_var.get()
-        config_text = f"Config: Center={center}us Range={range_val}us Dir={direction}"
+        config_text = _SERVO_CONFIG_FMT(center, range_val, direction)
         self.servo_config_var.set(config_text)
 
+    def _on_destroy(self, event):
+        """Stop display updates once the tab frame is destroyed."""
+        if event.widget != self.frame:
+            return
+        self._alive = False
+        if self._update_after_id is not None:
+            try:
+                self.parent.after_cancel(self._update_after_id)
+            except tk.TclError:
+                pass  # Parent already gone
+            self._update_after_id = None
+
     def _on_main_frame_resize(self, event):
         """Handle main tab frame resize events."""
         # Only respond to the main frame resize events
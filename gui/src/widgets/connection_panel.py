@@ -5,6 +5,12 @@ Provides standard connection interface for all tabs.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
+import threading
+
+try:
+    from serial.tools import list_ports
+except ImportError:
+    list_ports = None  # pyserial not installed; auto-detect reports it
 
 
 class ConnectionPanel:
@@ -71,33 +77,52 @@ class ConnectionPanel:
                 
     def _auto_detect(self):
         """Auto-detect Arduino port."""
-        try:
-            import serial.tools.list_ports
+        if list_ports is None:
+            messagebox.showerror("Auto-Detect", 
+                               "pyserial not available for auto-detection.\\n"
+                               "Please enter port manually.")
+            return
             
+        # Port enumeration can block for seconds on Windows, so it runs on a
+        # worker thread and the result is handed back to the Tk thread.
+        self.detect_btn.config(state='disabled')
+        threading.Thread(target=self._detect_ports, daemon=True).start()
+        
+    def _detect_ports(self):
+        """Find Arduino-like ports (runs on the worker thread)."""
+        arduino_ports = []
+        error = None
+        try:
             # Look for Arduino-like devices
-            arduino_ports = []
-            for port in serial.tools.list_ports.comports():
+            for port in list_ports.comports():
                 # Common Arduino VID/PID patterns
                 if any(keyword in (port.description or "").lower() for keyword in 
                       ['arduino', 'ch340', 'cp210', 'ftdi', 'usb serial']):
                     arduino_ports.append(port.device)
-                    
-            if arduino_ports:
-                # Use first detected port
-                self.port_var.set(arduino_ports[0])
-                messagebox.showinfo("Auto-Detect", 
-                                  f"Found Arduino on {arduino_ports[0]}\\n"
-                                  f"Click Connect to establish connection.")
-            else:
-                messagebox.showwarning("Auto-Detect", 
-                                     "No Arduino devices detected.\\n"
-                                     "Please check connections and try manual port entry.")
-        except ImportError:
-            messagebox.showerror("Auto-Detect", 
-                               "pyserial not available for auto-detection.\\n"
-                               "Please enter port manually.")
         except Exception as e:
-            messagebox.showerror("Auto-Detect Error", f"Detection failed: {e}")
+            error = e
+            
+        try:
+            self.parent.after(0, self._detect_done, arduino_ports, error)
+        except (tk.TclError, RuntimeError):
+            # Window closed while ports were being enumerated
+            pass
+            
+    def _detect_done(self, arduino_ports, error):
+        """Report auto-detect results on the Tk thread."""
+        self.detect_btn.config(state='normal')
+        if error is not None:
+            messagebox.showerror("Auto-Detect Error", f"Detection failed: {error}")
+        elif arduino_ports:
+            # Use first detected port
+            self.port_var.set(arduino_ports[0])
+            messagebox.showinfo("Auto-Detect", 
+                              f"Found Arduino on {arduino_ports[0]}\\n"
+                              f"Click Connect to establish connection.")
+        else:
+            messagebox.showwarning("Auto-Detect", 
+                                 "No Arduino devices detected.\\n"
+                                 "Please check connections and try manual port entry.")
             
     def pack(self, **kwargs):
         """Pack the connection panel frame."""